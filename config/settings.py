@@ -25,7 +25,8 @@ class SimpleConfig:
             'fps_monitoring': False,
             'memory_monitoring': False,
             'cpu_monitoring': False,
-            'processing_time_monitoring': False
+            'processing_time_monitoring': False,
+            'use_opencl': False  # Resize/convert display frames via cv2.UMat when OpenCL is present
         })()
         
         # Camera settings
@@ -6,6 +6,9 @@ from modules.error_handler import log_arduino_error, log_info, log_warning, Syst
 from modules.grading_module import convert_grade_to_arduino_command
 
 class ArduinoModule:
+    # Pending commands kept while the serial link is slow; further commands are dropped
+    COMMAND_QUEUE_SIZE = 64
+
     def __init__(self, message_queue):
         self.ser = None
         self.message_queue = message_queue
@@ -23,7 +26,7 @@ class ArduinoModule:
         }
         
         # Command queue for reliable delivery
-        self.command_queue = queue.Queue()
+        self.command_queue = queue.Queue(maxsize=self.COMMAND_QUEUE_SIZE)
         self.command_thread = None
         
         log_info(SystemComponent.ARDUINO, "ArduinoModule initialized")
@@ -149,6 +152,9 @@ class ArduinoModule:
                             time.sleep(0.5)  # Wait before retry
                 else:
                     log_arduino_error(f"Failed to send command '{command}' after {max_retries} attempts")
+                    # Callers only learn that the command was queued, so report the delivery failure
+                    if self.message_queue:
+                        self.message_queue.put(("status_update", f"Command '{command}' not delivered"))
                     
                 self.command_queue.task_done()
                 
@@ -242,8 +248,8 @@ class ArduinoModule:
             return False
             
         try:
-            # Add command to queue for processing
-            self.command_queue.put(command, timeout=1.0)
+            # Add command to queue for processing; never block the (GUI) caller on a busy serial link
+            self.command_queue.put_nowait(command)
             log_info(SystemComponent.ARDUINO, f"Queued command: '{command}'")
             return True
             
@@ -231,6 +231,34 @@ class CameraModule:
 
     def read_frame(self, camera_name):
         """Read a frame from the specified camera with enhanced error handling."""
+        return self._read_frame(camera_name, retrieve_only=False)
+
+    def grab_frame(self, camera_name):
+        """Advance the camera to its newest frame without decoding it.
+
+        Pair with retrieve_frame() to decode only the frames that are used.
+        Failures are not counted here; the next retrieve_frame() reports them.
+        """
+        if self.dev_mode:
+            return True
+        camera = self.cap_top if camera_name == "top" else self.cap_bottom
+        if camera is None or not camera.isOpened():
+            return False
+        try:
+            return camera.grab()
+        except Exception:
+            return False
+
+    def retrieve_frame(self, camera_name, out=None):
+        """Decode the frame last advanced to by grab_frame(), with read_frame()'s error handling.
+
+        If out matches the frame's shape and dtype, the frame is decoded into it
+        instead of a newly allocated array.
+        """
+        return self._read_frame(camera_name, retrieve_only=True, out=out)
+
+    def _read_frame(self, camera_name, retrieve_only, out=None):
+        """Shared body of read_frame/retrieve_frame; retrieve_only decodes the already grabbed frame"""
         if self.dev_mode:
             # Use laptop webcam for dev mode
             return self._read_dev_frame(camera_name)
@@ -246,7 +274,12 @@ class CameraModule:
             return False, None
             
         try:
-            ret, frame = camera.read()
+            if not retrieve_only:
+                ret, frame = camera.read()
+            elif out is not None:
+                ret, frame = camera.retrieve(out)
+            else:
+                ret, frame = camera.retrieve()
 
             if not ret or frame is None:
                 # Frame read failed
@@ -148,10 +148,13 @@ class ConfigurationManager:
     def update_model_config(self, model_name: str, updates: Dict) -> bool:
         """Update model configuration with validation"""
         try:
-            if model_name not in self.config["models"]:
-                self.config["models"][model_name] = {}
+            model_config = self.config["models"].setdefault(model_name, {})
 
-            self.config["models"][model_name].update(updates)
+            # Saving unchanged values would only rewrite the same file
+            if all(key in model_config and model_config[key] == value for key, value in updates.items()):
+                return True
+
+            model_config.update(updates)
 
             if self.validate_config(self.config):
                 self.save_config()
@@ -234,6 +237,13 @@ class ModelHealthMonitor:
 
     def track_inference(self, model_name: str, inference_time: float, success: bool):
         """Track inference performance metrics"""
+        self.track_inference_batch(model_name, [inference_time], int(success))
+
+    def track_inference_batch(self, model_name: str, inference_times: List[float], success_count: int):
+        """Track a batch of inference measurements in one update"""
+        if not inference_times:
+            return
+
         if model_name not in self.metrics:
             self.metrics[model_name] = {
                 'inference_times': [],
@@ -243,10 +253,9 @@ class ModelHealthMonitor:
             }
 
         metrics = self.metrics[model_name]
-        metrics['inference_times'].append(inference_time)
-        metrics['total_count'] += 1
-        if success:
-            metrics['success_count'] += 1
+        metrics['inference_times'].extend(inference_times)
+        metrics['total_count'] += len(inference_times)
+        metrics['success_count'] += success_count
 
         # Keep only last 100 measurements
         if len(metrics['inference_times']) > 100:
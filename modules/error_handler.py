@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
@@ -26,6 +29,7 @@ class ErrorHandler:
     
     def __init__(self, log_directory="wood_sorting_app/logs"):
         self.log_directory = log_directory
+        self.log_listener = None
         self.setup_logging()
         self.error_counts = {}
         self.last_errors = {}
@@ -57,12 +61,20 @@ class ErrorHandler:
             console_handler.setLevel(logging.INFO)
             console_handler.setFormatter(formatter)
             
+            # Formatting and file/console I/O run on a listener thread so callers
+            # on the camera and inference loops only pay for a queue put
+            log_queue = queue.SimpleQueue()
+            self.log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, error_handler, console_handler,
+                respect_handler_level=True
+            )
+            self.log_listener.start()
+            atexit.register(self.log_listener.stop)
+
             # Configure root logger
             self.logger = logging.getLogger("WoodSortingSystem")
             self.logger.setLevel(logging.DEBUG)
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(error_handler)
-            self.logger.addHandler(console_handler)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
             
             self.logger.info("Error handling system initialized")
             
@@ -1,5 +1,14 @@
 from modules.utils_module import GRADE_G2_0, GRADE_G2_1, GRADE_G2_2, GRADE_G2_3, GRADE_G2_4, GRADING_THRESHOLDS, WOOD_PALLET_WIDTH_MM
 
+# Display color for each grade; get_grade_color falls back to gray
+GRADE_COLORS = {
+    GRADE_G2_0: 'dark green',
+    GRADE_G2_1: 'green',
+    GRADE_G2_2: 'orange',
+    GRADE_G2_3: 'dark orange',
+    GRADE_G2_4: 'red'
+}
+
 def grade_individual_defect(defect_type, size_mm, percentage):
     """Grade an individual defect based on SS-EN 1611-1 standards"""
     if defect_type not in GRADING_THRESHOLDS:
@@ -109,14 +118,7 @@ def convert_grade_to_arduino_command(standard_grade):
 
 def get_grade_color(grade):
     """Get color coding for grades"""
-    color_map = {
-        GRADE_G2_0: 'dark green',
-        GRADE_G2_1: 'green', 
-        GRADE_G2_2: 'orange',
-        GRADE_G2_3: 'dark orange',
-        GRADE_G2_4: 'red'
-    }
-    return color_map.get(grade, 'gray')
+    return GRADE_COLORS.get(grade, 'gray')
 
 def calculate_grade(defect_dict):
     """Calculate grade based on defect dictionary and return grade info"""
@@ -127,26 +129,26 @@ def calculate_grade(defect_dict):
             'grade': GRADE_G2_0,  # Perfect wood
             'text': 'Perfect (No Defects)',
             'total_defects': 0,
-            'color': 'dark green'
+            'color': GRADE_COLORS[GRADE_G2_0]
         }
     elif total_defects <= 2:
         return {
             'grade': GRADE_G2_0,  # Good grade
             'text': f'Good (G2-0) - {total_defects} defects',
             'total_defects': total_defects,
-            'color': 'green'
+            'color': GRADE_COLORS[GRADE_G2_1]  # Green marks a few defects; dark green is kept for defect-free wood
         }
     elif total_defects <= 6:
         return {
             'grade': GRADE_G2_2,  # Fair grade
             'text': f'Fair (G2-2) - {total_defects} defects',
             'total_defects': total_defects,
-            'color': 'orange'
+            'color': GRADE_COLORS[GRADE_G2_2]
         }
     else:
         return {
             'grade': GRADE_G2_4,  # Poor grade
             'text': f'Poor (G2-4) - {total_defects} defects',
             'total_defects': total_defects,
-            'color': 'red'
+            'color': GRADE_COLORS[GRADE_G2_4]
         }
\ No newline at end of file
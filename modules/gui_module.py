@@ -8,16 +8,23 @@ Includes enhanced error handling, performance monitoring, and live detection cap
 
 import sys
 import cv2
+import json
 import logging
+import traceback
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QGridLayout, QCheckBox, QTabWidget, QGroupBox, QTextEdit, QProgressBar, QScrollArea, QSizePolicy, QComboBox, QDoubleSpinBox, QSpinBox, QFormLayout, QLineEdit, QListWidget, QListWidgetItem
+    QPushButton, QFrame, QGridLayout, QCheckBox, QTabWidget, QGroupBox, QTextEdit, QPlainTextEdit, QProgressBar, QScrollArea, QSizePolicy, QComboBox, QDoubleSpinBox, QSpinBox, QFormLayout, QLineEdit, QListView
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QFont, QColor
-from PyQt5.QtCore import Qt, QTimer, QDateTime, QThread, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QFont, QColor, QPen
+from PyQt5.QtCore import Qt, QTimer, QDateTime, QThread, QObject, QAbstractListModel, QModelIndex, pyqtSignal, pyqtSlot
 import queue
 import time
 import threading
+import itertools
+from collections import Counter, deque
+from functools import wraps
+from operator import itemgetter
 
 try:
     import degirum_tools
@@ -30,9 +37,10 @@ from modules.camera_module import CameraModule
 from modules.detection_module import DetectionModule
 from modules.arduino_module import ArduinoModule
 from modules.reporting_module import ReportingModule
-from modules.grading_module import calculate_grade, determine_final_grade, get_grade_color
+from modules.grading_module import calculate_grade, determine_final_grade, determine_surface_grade, get_grade_color
 from modules import grading_module
 from modules.utils_module import TOP_CAMERA_PIXEL_TO_MM, BOTTOM_CAMERA_PIXEL_TO_MM, WOOD_PALLET_WIDTH_MM, map_model_output_to_standard, calculate_defect_size
+from modules.utils_module import GRADE_G2_0, GRADE_G2_1, GRADE_G2_2, GRADE_G2_3, GRADE_G2_4
 from modules.error_handler import (
     log_info, log_warning, log_error, SystemComponent,
     get_error_summary, error_handler, log_arduino_error
@@ -44,7 +52,496 @@ from config.settings import get_config
 from modules.roi_module import ROIModule, ROIManager, OverlapDetector, ROIBasedWorkflowManager, ROIVisualizer, ROIStatus
 from modules.wood_detection_module import WoodDetectionEngine
 
+# Hardcoded top and bottom ROIs as (x1, y1, x2, y2) on the 1280x720 frame
+# From log: "Top: (64,0) to (1216,108), Bottom: (64,612) to (1216,720)"
+TOP_BOTTOM_ROIS = np.array([[64, 0, 1216, 108], [64, 612, 1216, 720]], dtype=np.int32)
+
+# Overlay text font and common BGR colors shared by the frame drawing paths
+OVERLAY_FONT = cv2.FONT_HERSHEY_SIMPLEX
+COLOR_WHITE = (255, 255, 255)
+COLOR_GREEN = (0, 255, 0)
+COLOR_RED = (0, 0, 255)
+COLOR_CYAN = (255, 255, 0)
+COLOR_BLUE = (255, 0, 0)
+COLOR_YELLOW = (0, 255, 255)
+COLOR_ORANGE = (0, 165, 255)
+COLOR_GRAY = (128, 128, 128)
+
+# ROI status indicator colors (BGR)
+ROI_STATUS_DEFAULT_COLOR = COLOR_GRAY
+ROI_STATUS_COLORS = {
+    ROIStatus.ACTIVE: COLOR_GREEN,
+    ROIStatus.OVERLAPPING: COLOR_ORANGE,
+    ROIStatus.INACTIVE: ROI_STATUS_DEFAULT_COLOR,
+    ROIStatus.ERROR: COLOR_RED
+}
+# ROI status display text, resolved once from the enum
+ROI_STATUS_TEXT = {status: status.value for status in ROIStatus}
+
+# Detection state label stylesheets
+DETECTION_STATE_STYLES = {
+    state: f"font-size: 12px; color: {color}; font-weight: bold;"
+    for state, color in (
+        ("Waiting", "#666"),
+        ("Detecting", "#f39c12"),
+        ("Grading", "#27ae60"),
+        ("Processing", "#3498db"),
+    )
+}
+
+# Model health label stylesheets by HealthStatus value
+MODEL_HEALTH_STYLES = {
+    health: f"font-size: 16px; font-weight: bold; padding: 10px; color: {color};"
+    for health, color in (
+        ("healthy", "#27ae60"),  # Green
+        ("degraded", "#f39c12"),  # Orange
+        ("unhealthy", "#e74c3c"),  # Red
+    )
+}
+MODEL_HEALTH_UNKNOWN_STYLE = "font-size: 16px; font-weight: bold; padding: 10px; color: #95a5a6;"  # Gray
+
+# Good/warning/bad status label stylesheets
+STATUS_STYLE_GOOD = "color: #27ae60;"
+STATUS_STYLE_WARNING = "color: #f39c12;"
+STATUS_STYLE_BAD = "color: #e74c3c;"
+
+# Camera health label stylesheets by CameraStatus value; anything else is shown as bad
+CAMERA_HEALTH_STYLES = {"available": STATUS_STYLE_GOOD, "in_use": STATUS_STYLE_WARNING}
+
+# System status bar: style and single-letter camera states (A=Available, I=In Use, anything else E=Error)
+SYSTEM_STATUS_STYLE = "font-size: 12px; font-weight: bold; color: #2c3e50;"
+CAMERA_STATUS_SHORT = {"available": "A", "in_use": "I"}
+
+# Wood type suggested by the most common defect when no ratio rule applies
+WOOD_TYPE_BY_DEFECT = {'knot': "Pine", 'crack': "Oak", 'resin': "Pine"}
+
+# Wood detection overlay colors (BGR) by confidence tier
+WOOD_COLOR_HIGH_CONFIDENCE = COLOR_GREEN  # Green for high confidence
+WOOD_COLOR_MEDIUM_CONFIDENCE = COLOR_YELLOW  # Yellow for medium confidence
+WOOD_COLOR_LOW_CONFIDENCE = COLOR_ORANGE  # Orange for low confidence
+
+# Bounding box outline as a closed polyline over (x1, y1, x2, y2), in cv2.rectangle's point order
+WOOD_BOX_POINT_INDEX = np.array([[0, 1], [2, 1], [2, 3], [0, 3]])
+
+# Corner markers as L-shaped 3-point polylines: corner picked from (x1, y1, x2, y2), then
+# offset along one edge, the corner itself, and along the other edge
+WOOD_CORNER_MARKER_SIZE = 15
+WOOD_CORNER_POINT_INDEX = np.array([
+    [0, 1],  # Top-left
+    [2, 1],  # Top-right
+    [0, 3],  # Bottom-left
+    [2, 3],  # Bottom-right
+])
+WOOD_CORNER_MARKER_OFFSETS = WOOD_CORNER_MARKER_SIZE * np.array([
+    [[0, 1], [0, 0], [1, 0]],
+    [[-1, 0], [0, 0], [0, 1]],
+    [[0, -1], [0, 0], [1, 0]],
+    [[-1, 0], [0, 0], [0, -1]],
+], dtype=np.int32)
+
+def _is_valid_frame_fast(frame):
+    """O(1) sanity check of a camera frame's type, shape and dtype; never touches pixel data"""
+    if not isinstance(frame, np.ndarray) or frame.ndim != 3 or frame.dtype != np.uint8:
+        return False
+    height, width, channels = frame.shape
+    # Reject empty, tiny or extremely large frames
+    return channels in (1, 3, 4) and 16 <= width <= 4096 and 16 <= height <= 4096
+
+# Minimum seconds between on-screen warnings from the same overlay helper
+GUI_SAFE_WARNING_INTERVAL = 1.0
+# Suppressed errors from one helper are written to the error log once per this many
+GUI_SAFE_LOG_EVERY = 50
+
+def gui_safe(label, default=None):
+    """Guard a per-frame GUI helper: on error, warn at most once per interval and return default.
+
+    Overlay helpers run on every frame, so a persistent failure would otherwise
+    flood the message log; suppressed occurrences are counted into the next warning.
+    Shown warnings and every GUI_SAFE_LOG_EVERY-th suppressed one go to the error log.
+    """
+    def decorator(func):
+        state = {"last": float("-inf"), "suppressed": 0}
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                now = time.monotonic()
+                if now - state["last"] >= GUI_SAFE_WARNING_INTERVAL:
+                    suppressed = state["suppressed"]
+                    suffix = f" ({suppressed} more suppressed)" if suppressed else ""
+                    message = f"Error {label}: {str(e)}{suffix}"
+                    self.display_message(message, "warning")
+                    log_warning(SystemComponent.GUI, message)
+                    state["last"] = now
+                    state["suppressed"] = 0
+                else:
+                    state["suppressed"] += 1
+                    if state["suppressed"] % GUI_SAFE_LOG_EVERY == 0:
+                        log_warning(SystemComponent.GUI,
+                                    f"Error {label}: {str(e)} ({state['suppressed']} suppressed so far)")
+                return default
+        return wrapper
+    return decorator
+
+# Qt >= 5.14 can wrap BGR buffers as-is; older Qt (e.g. distro PyQt5 on the Pi) needs an RGB copy
+QIMAGE_FORMAT_BGR888 = getattr(QImage, 'Format_BGR888', None)
+
+# ROI outline color in the ROI configuration preview (COLOR_BLUE as a Qt color)
+ROI_PREVIEW_COLOR = QColor(*COLOR_BLUE[::-1])
+
+# Shared stand-in for detections without features; never mutated
+_EMPTY_FEATURES = {}
+
+class _MockResult:
+    """Stand-in for a predict_stream result, reused across mock frames"""
+    __slots__ = ('results', 'image_overlay')
+
+    def __init__(self):
+        self.results = []  # Mock empty results
+        self.image_overlay = None
+
+class ROIListModel(QAbstractListModel):
+    """List model of (roi_id, display text) rows for the ROI list view.
+
+    set_rows diffs against the current rows, so a refresh only inserts,
+    removes or repaints the rows that actually changed and the view keeps
+    its selection on untouched rows.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        roi_id, text = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.UserRole:
+            return roi_id
+        return None
+
+    def set_rows(self, rows):
+        """Replace the rows, emitting only the changes between old and new"""
+        old = self._rows
+        # Rows whose IDs match at the start and end are kept; only the middle is replaced
+        prefix = 0
+        limit = min(len(old), len(rows))
+        while prefix < limit and old[prefix][0] == rows[prefix][0]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old[len(old) - 1 - suffix][0] == rows[len(rows) - 1 - suffix][0]):
+            suffix += 1
+
+        removed_end = len(old) - suffix
+        if removed_end > prefix:
+            self.beginRemoveRows(QModelIndex(), prefix, removed_end - 1)
+            del self._rows[prefix:removed_end]
+            self.endRemoveRows()
+
+        inserted = rows[prefix:len(rows) - suffix]
+        if inserted:
+            self.beginInsertRows(QModelIndex(), prefix, prefix + len(inserted) - 1)
+            self._rows[prefix:prefix] = inserted
+            self.endInsertRows()
+
+        # Kept rows may still have new text (e.g. a status or name change)
+        for row, new_row in enumerate(rows):
+            if self._rows[row] != new_row:
+                self._rows[row] = new_row
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+class FrameRenderWorker(QObject):
+    """Converts OpenCV frames to scaled QImages on a background thread.
+
+    QPixmap may only be created on the GUI thread, so the worker emits a
+    QImage and the receiving slot does the final QPixmap.fromImage/setPixmap.
+
+    Color frames are resized and converted into one persistent RGB buffer that
+    the emitted QImage wraps without copying. The GUI only requests the next
+    render after QPixmap.fromImage has copied the previous one out.
+
+    With use_opencl and an OpenCL device available, the resize and color
+    conversion run through cv2.UMat and only the final RGB image is downloaded.
+    """
+    render_requested = pyqtSignal(object, object)
+    image_ready = pyqtSignal(QImage)
+    # Emitted instead of image_ready when a frame can't be rendered, so the GUI stops waiting for it
+    render_failed = pyqtSignal(str)
+
+    def __init__(self, use_opencl=False):
+        super().__init__()
+        self._rgb_buffer = None
+        self._use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        self.render_requested.connect(self.render)
+
+    def _render_color(self, frame, target_size):
+        """Resize a BGR frame to fit target_size and convert it to RGB in the persistent buffer"""
+        h, w = frame.shape[:2]
+        scale = min(target_size.width() / w, target_size.height() / h)
+        out_w, out_h = max(1, int(w * scale)), max(1, int(h * scale))
+
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        if self._use_opencl:
+            rgb = cv2.cvtColor(cv2.resize(cv2.UMat(frame), (out_w, out_h), interpolation=interpolation),
+                               cv2.COLOR_BGR2RGB)
+            # get() downloads into a new array; keep it referenced while the QImage wraps it
+            self._rgb_buffer = rgb.get()
+            return QImage(self._rgb_buffer.data, out_w, out_h, 3 * out_w, QImage.Format_RGB888)
+
+        if self._rgb_buffer is None or self._rgb_buffer.shape[:2] != (out_h, out_w):
+            self._rgb_buffer = np.empty((out_h, out_w, 3), dtype=np.uint8)
+
+        if (out_w, out_h) == (w, h):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        else:
+            cv2.resize(frame, (out_w, out_h), dst=self._rgb_buffer, interpolation=interpolation)
+            cv2.cvtColor(self._rgb_buffer, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+
+        return QImage(self._rgb_buffer.data, out_w, out_h, 3 * out_w, QImage.Format_RGB888)
+
+    @pyqtSlot(object, object)
+    def render(self, frame, target_size):
+        """Color-convert, wrap and scale a frame to the target label size"""
+        try:
+            if len(frame.shape) == 3 and frame.shape[2] == 3:
+                if target_size.width() > 0 and target_size.height() > 0:
+                    self.image_ready.emit(self._render_color(frame, target_size))
+                    return
+                rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            else:
+                rgb_image = frame
+
+            h, w = rgb_image.shape[:2]
+            ch = rgb_image.shape[2] if len(rgb_image.shape) > 2 else 1
+
+            if ch == 3:
+                qt_image = QImage(rgb_image.data, w, h, ch * w, QImage.Format_RGB888)
+            elif ch == 1:
+                qt_image = QImage(rgb_image.data, w, h, w, QImage.Format_Grayscale8)
+            else:
+                self.render_failed.emit(f"Unsupported number of channels: {ch}")
+                return
+
+            if qt_image.isNull():
+                self.render_failed.emit("QImage is null")
+                return
+
+            scaled_image = qt_image.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # scaled() shares the numpy buffer when no resize was needed; detach before it goes away
+            if scaled_image.size() == qt_image.size():
+                scaled_image = scaled_image.copy()
+
+            self.image_ready.emit(scaled_image)
+        except Exception as e:
+            self.render_failed.emit(f"Exception in FrameRenderWorker.render: {str(e)}")
+
+class FrameGrabber(QThread):
+    """Reads top/bottom camera frames on a background thread.
+
+    The GUI timer takes the newest pair with get_latest() instead of blocking
+    on camera reads itself. Each read publishes a new pair (None for a failed
+    read), so a pair is handed out at most once.
+
+    Both cameras are grabbed every round to keep their buffers current, but
+    frames are only decoded once the previous pair has been taken, so frames
+    the GUI would never show are not decoded.
+
+    Frames are decoded into a ring of RING_SIZE preallocated buffers per
+    camera. A published frame stays valid until RING_SIZE - 1 newer pairs
+    have been taken; consumers that keep one longer must copy it.
+    """
+    # Back-off after a round where neither camera delivered a frame
+    FAILED_READ_BACKOFF_S = 0.05
+    # Decode buffers per camera
+    RING_SIZE = 4
+
+    def __init__(self, camera_module, parent=None):
+        super().__init__(parent)
+        self.camera_module = camera_module
+        self._latest = (None, None)
+        self._seq = 0
+        self._taken_seq = 0
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()  # held for the duration of each camera read
+        self._running = threading.Event()
+        self._running.set()
+        self._stop = threading.Event()
+        # Allocated by the first decode into each slot, reused afterwards
+        self._ring = {"top": [None] * self.RING_SIZE, "bottom": [None] * self.RING_SIZE}
+        self._ring_index = 0
+
+    def _retrieve_into_ring(self, camera_name):
+        """Decode camera_name's grabbed frame into the current ring slot"""
+        slots = self._ring[camera_name]
+        _, frame = self.camera_module.retrieve_frame(camera_name, slots[self._ring_index])
+        if frame is not None:
+            slots[self._ring_index] = frame  # New array on first use or a resolution change
+        return frame
+
+    def run(self):
+        while not self._stop.is_set():
+            if not self._running.is_set():
+                self._stop.wait(self.FAILED_READ_BACKOFF_S)
+                continue
+            with self._read_lock:
+                if not self._running.is_set():
+                    continue
+                camera_module = self.camera_module
+                top_grabbed = camera_module.grab_frame("top")
+                bottom_grabbed = camera_module.grab_frame("bottom")
+                with self._lock:
+                    wanted = self._seq == self._taken_seq
+                if wanted:
+                    top_frame = self._retrieve_into_ring("top")
+                    bottom_frame = self._retrieve_into_ring("bottom")
+            if wanted:
+                with self._lock:
+                    self._latest = (top_frame, bottom_frame)
+                    self._seq += 1
+                self._ring_index = (self._ring_index + 1) % self.RING_SIZE
+            if not (top_grabbed or bottom_grabbed):
+                self._stop.wait(self.FAILED_READ_BACKOFF_S)
+
+    def get_latest(self):
+        """Return the newest (top, bottom) pair, or None if nothing new was read since the last call"""
+        with self._lock:
+            if self._seq == self._taken_seq:
+                return None
+            self._taken_seq = self._seq
+            return self._latest
+
+    def pause(self):
+        """Stop reading and wait for an in-flight read to finish, so the cameras can be handed off"""
+        self._running.clear()
+        with self._read_lock:
+            pass
+
+    def resume(self):
+        """Resume reading after pause()"""
+        self._running.set()
+
+    def stop(self, timeout_ms=2000):
+        """Ask the thread to exit and wait for it"""
+        self._stop.set()
+        self.wait(timeout_ms)
+
+class InferenceWorker(QThread):
+    """Runs live detection off the GUI thread.
+
+    Holds one pending frame per camera; submitting a newer frame replaces
+    one that has not been picked up yet, so a slow model drops stale frames
+    instead of queueing them. Results come back through signals.
+
+    One worker serves both cameras because they share one defect model.
+    When both have a frame waiting, the camera not served last goes next,
+    so a slow model alternates between them instead of starving one.
+    """
+    detection_ready = pyqtSignal(str, object, object, object)  # camera, annotated frame, defects, defect list
+    detection_failed = pyqtSignal(str, str)  # camera, error message
+
+    def __init__(self, detection_module, parent=None):
+        super().__init__(parent)
+        self.detection_module = detection_module
+        self._pending = {}
+        self._last_camera = None
+        self._cond = threading.Condition()
+        self._stopping = False
+
+    def submit(self, camera_name, frame):
+        """Queue frame for detection, replacing any unprocessed frame from the same camera"""
+        with self._cond:
+            self._pending[camera_name] = frame
+            self._cond.notify()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                camera_name, frame = self._take_pending()
+            try:
+                annotated_frame, defects, defect_list, _ = self.detection_module.analyze_frame(frame, camera_name)
+            except Exception as e:
+                print(f"DEBUG: Exception in live detection for {camera_name} camera: {str(e)}")
+                traceback.print_exc()
+                self.detection_failed.emit(camera_name, str(e))
+                continue
+            self.detection_ready.emit(camera_name, annotated_frame, defects, defect_list)
+
+    def _take_pending(self):
+        """Pop the next (camera, frame), preferring the camera not served last; caller holds _cond"""
+        camera_name = next((name for name in self._pending if name != self._last_camera), None)
+        if camera_name is None:
+            camera_name = self._last_camera
+        self._last_camera = camera_name
+        return camera_name, self._pending.pop(camera_name)
+
+    def stop(self, timeout_ms=2000):
+        """Ask the thread to exit after the current frame and wait for it"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self.wait(timeout_ms)
+
 class WoodSortingApp(QMainWindow):
+    # Bound on Arduino messages handled per UI tick so bursts can't starve rendering
+    MAX_MESSAGES_PER_TICK = 32
+    # Per-frame predict_stream results kept in memory; session totals are tracked separately
+    PREDICT_STREAM_RESULTS_MAXLEN = 4096
+    # Rate at which predict_stream results are applied to widgets (display rate, not inference rate)
+    FRAME_UPDATE_INTERVAL_MS = 100
+    # Attempts to copy a published frame before keeping the previous one for this tick
+    FRAME_READ_RETRIES = 3
+    # Minimum seconds between performance tab refreshes
+    PERFORMANCE_DISPLAY_INTERVAL_S = 1.0
+    # Message tokens that mark a predict_stream error as recoverable, checked in order
+    RECOVERABLE_ERROR_TOKENS = ("timeout", "connection")
+    # Rendered ROI status bars kept before the cache is reset
+    STATUS_BAR_CACHE_SIZE = 16
+    # With ROI debugging on, print one intersection check out of this many
+    ROI_DEBUG_EVERY = 30
+    # Minimum seconds between live detection runs per camera; the feed timer ticks faster
+    LIVE_DETECTION_INTERVAL_S = 0.2
+    # Feed timer interval (ms) when ticks finish in time
+    FEED_INTERVAL_MS = 50
+    # An overrunning tick stretches the next interval to this multiple of its duration
+    FEED_OVERRUN_FACTOR = 1.2
+    # Quiet period before a requested ROI preview redraw is drawn
+    ROI_PREVIEW_DEBOUNCE_MS = 30
+    # Quiet period after the last ROI edit before the ROI config is written to disk
+    ROI_SAVE_DEBOUNCE_MS = 500
+    # Log lines are buffered and appended to the log tab in one batch per interval
+    LOG_FLUSH_INTERVAL_MS = 500
+    # Oldest log tab lines are dropped beyond this many
+    LOG_MAX_LINES = 2000
+    # ROIs restored by "Reset ROI config": (camera, roi_id, coordinates, name, overlap threshold)
+    DEFAULT_ROIS = (
+        ("top", "top_roi_1", (64, 0, 1216, 108), "Top ROI", 0.3),
+        ("bottom", "bottom_roi_1", (64, 612, 1216, 720), "Bottom ROI", 0.3),
+    )
+
+    # Emitted from the predict_stream thread; delivered to the GUI thread via a queued connection
+    frame_processed = pyqtSignal(dict)
+    # Emitted when the predict_stream thread exits so the camera hand-back runs on the GUI thread
+    predict_stream_finished = pyqtSignal()
+    # Emitted by the log export thread with (message, message type) for display_message
+    log_export_finished = pyqtSignal(str, str)
+    # Emitted from the performance monitor thread with its latest metrics
+    performance_updated = pyqtSignal(object)
+
     def __init__(self, dev_mode=False, config=None):
         super().__init__()
         self.dev_mode = dev_mode
@@ -71,16 +568,33 @@ class WoodSortingApp(QMainWindow):
         # Initialize message queue for thread communication
         self.message_queue = queue.Queue()
 
+        # Exact-match Arduino message handlers (legacy IR protocol)
+        self._arduino_handlers = {
+            "B": self._handle_legacy_ir_broken,
+            "IR: 0": self._handle_legacy_ir_broken,
+            "IR:0": self._handle_legacy_ir_broken,
+            "IR: 1": self._handle_legacy_ir_cleared,
+            "IR:1": self._handle_legacy_ir_cleared
+        }
+
         # Initialize performance monitoring
         self.performance_monitor = get_performance_monitor()
+        self._last_performance_display = 0.0
         if self.config.performance.enable_monitoring:
+            # The monitor calls back from its own thread; widgets are updated on the GUI thread
+            self.performance_updated.connect(self.update_performance_display, Qt.QueuedConnection)
             start_performance_monitoring()
-            self.performance_monitor.add_update_callback(self.update_performance_display)
+            self.performance_monitor.add_update_callback(self.performance_updated.emit)
 
         # Initialize modules
         self.camera_module = CameraModule(dev_mode=self.dev_mode)
         self.camera_module.initialize_cameras()  # Initialize cameras
         self.detection_module = DetectionModule(dev_mode=self.dev_mode)
+        # Status accessors bound once for update_system_status; None if the module lacks them
+        self._get_model_health = getattr(self.detection_module, 'get_model_health_status', None)
+        self._get_camera_status = getattr(self.detection_module, 'get_camera_status', None)
+        health_monitor = getattr(getattr(self.detection_module, 'model_manager', None), 'health_monitor', None)
+        self._model_health_metrics = getattr(health_monitor, 'metrics', None)
         self.arduino_module = ArduinoModule(message_queue=self.message_queue)
 
         # Initialize ROI-based wood detection system
@@ -90,6 +604,10 @@ class WoodSortingApp(QMainWindow):
             grading_module,
             self.arduino_module
         )
+        # The manager is fixed for the app's lifetime; ROI handlers use it directly
+        self._roi_manager = self.roi_module.roi_manager
+        # Suffixes for new ROI ids: seeded from the clock like the old ids, but unique within a second
+        self._roi_id_counter = itertools.count(int(time.time()))
         
         # Setup Arduino connection (only in non-dev mode)
         if not self.dev_mode:
@@ -106,43 +624,146 @@ class WoodSortingApp(QMainWindow):
         self.auto_detection_active = False # Triggered by IR beam
         self.live_detection_var = False # For live inference mode (continuous)
         self.auto_grade_var = False # For auto grading in live mode
+        self.roi_overlay_var = True # Mirrors roi_checkbox for the feed loop
+        self.show_wood_var = True # Mirrors wood_detection_checkbox for the feed loop
         
         # Wood detection state (ROI-triggered workflow)
         self.roi_triggered = False
         self.wood_confirmed = False
         self.roi_detection_active = False
         self.current_roi_session = None
+        self.active_roi_sessions = {}
+        self._roi_debug = False  # print sampled ROI intersection details
+        self._roi_debug_counter = 0
+        self._status_bar_cache = {}  # (width, mode, active ROIs, overlaps) -> rendered status bar
+        self._misalign_cache = {}  # (height, width) -> rendered misalignment text patch
+        self._roi_overlay_cache = {}  # camera -> (ROI config version, active ROI ids, their configs)
+        self.ir_triggered = False
+        self.no_wood_timer = None
 
         # Predict stream state
         self.predict_stream_active = False
         self.predict_stream_thread = None
-        self.predict_stream_results = []
+        self._predict_stream_stop = threading.Event()  # set to wake and stop the predict_stream loops
+        self.predict_stream_results = deque(maxlen=self.PREDICT_STREAM_RESULTS_MAXLEN)
+        self._frame_running_total = 0  # frames processed this predict_stream session
+        self._defect_running_total = 0  # defects counted this predict_stream session
+        self._defect_type_totals = Counter()  # per-type defect counts this predict_stream session
         self.latest_annotated_frame = None
+        # Double-buffered predict_stream frames: writer fills slot (seq+1)&1, then bumps seq;
+        # the GUI copies slot seq&1 and re-checks seq (see _read_published_frame)
+        self._frame_slots = None
+        self._frame_seq = 0
+        self._frame_seq_applied = 0
+        self._last_grade_frame = 0
+        self._gui_feed_paused = False
+        self._last_health_update = 0.0
+        # Session counters, reset by start_predict_stream_inference
+        self._inference_start_time = 0.0
+        self._inference_frame_count = 0
+        self._inference_error_count = 0
+        self._performance_report = None
+        self._performance_report_key = None  # session state _performance_report was built from
 
         # Initialize variables for statistics and logging
         self.total_pieces_processed = 0
-        self.session_start_time = QDateTime.currentMSecsSinceEpoch() / 1000 # Unix timestamp
+        self.session_start_time = time.time() # Unix timestamp
+        self.session_start_monotonic = time.monotonic() # Duration math, immune to clock changes
+        self._last_session_seconds = None # Duration last shown in session_duration_label
         self.grade_counts = {0: 0, 1: 0, 2: 0, 3: 0}
         self.live_stats = {"grade0": 0, "grade1": 0, "grade2": 0, "grade3": 0}
+        self._live_stats_keys = {grade: f"grade{grade}" for grade in self.grade_counts}
+        self._live_stats_dirty = True  # grade counter labels need refreshing
         self.session_log = []
 
         # Store original frame sizes and defect information
         self.top_frame_original = None
         self.bottom_frame_original = None
+        self._roi_preview_source = {}  # camera -> full-size QPixmap reused for each new preview frame
+        self._roi_preview_font = QFont("Sans", 10)  # ROI label font in the preview
+        self._roi_preview_last = None  # (source frame, preview key) currently shown in the ROI preview
+        self._roi_preview_base = {}  # camera -> (source frame, label size, scaled pixmap, scale) for the ROI preview
         self.current_defects = {}
         self.current_grade_info = None
         self.wood_classification = "Unknown"  # Wood type classification
         self.detection_state = "Waiting"  # Detection state for UI
+        self._detection_state_shown = False  # whether detection_state has been applied to its label yet
+        self._last_health_key = None  # model health fields last shown by update_model_health_display
+        # Live detection cadence: last run time and last annotated frame per camera
+        self._last_detection_times = {"top": 0.0, "bottom": 0.0}
+        self._last_annotated_frames = {"top": None, "bottom": None}
+
+        # Precomputed stylesheets - setStyleSheet re-parses QSS, so only build each string once
+        self._grade_stylesheets = {
+            grade: self._build_grade_stylesheet(grade)
+            for grade in (GRADE_G2_0, GRADE_G2_1, GRADE_G2_2, GRADE_G2_3, GRADE_G2_4)
+        }
+        self._last_grade_shown = None
+        self._grade_sent_messages = {
+            grade: self._build_grade_sent_messages(grade)
+            for grade in (GRADE_G2_0, GRADE_G2_1, GRADE_G2_2, GRADE_G2_3, GRADE_G2_4)
+        }
+        self._last_widget_values = {}  # (widget, 'text'|'style') -> last value applied
+        self._last_arduino_state = None  # (connected, port) last shown by update_arduino_status
+        self._last_defect_details_sig = None  # inputs last rendered by update_defect_details
+        self._camera_status_stylesheets = {
+            True: "font-size: 12px; color: green;",
+            False: "font-size: 12px; color: red;"
+        }
+        self._arduino_status_stylesheets = {
+            True: "font-size: 11px; color: green; font-weight: bold;",
+            False: "font-size: 11px; color: red; font-weight: bold;",
+            None: "font-size: 11px; color: orange; font-weight: bold;"
+        }
 
         # UI initialization
         self.setup_connections()
         self.setup_ui()
+        self.setup_frame_render_workers()
         self.setup_dev_mode()
         
+        # Camera reads happen on a producer thread; update_feeds only takes the newest frames
+        self.frame_grabber = None
+        if not self.dev_mode:
+            self.frame_grabber = FrameGrabber(self.camera_module, self)
+            self.frame_grabber.start()
+
+        # Live detection runs on its own thread; update_feeds submits frames and shows results
+        self.inference_worker = InferenceWorker(self.detection_module, self)
+        self.inference_worker.detection_ready.connect(self._on_detection_ready, Qt.QueuedConnection)
+        self.inference_worker.detection_failed.connect(self._on_detection_failed, Qt.QueuedConnection)
+        self.inference_worker.start()
+
         # Start the UI update timer
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update_feeds)
-        self.timer.start(50)  # Update every 50ms (20 FPS)
+        self._feed_interval_ms = self.FEED_INTERVAL_MS
+        self.timer.start(self._feed_interval_ms)  # Update every 50ms (20 FPS)
+
+        # predict_stream analyzers only emit frame_processed; widgets are updated from here
+        self._pending_frame_update = None
+        self._pending_status_text = None
+        self.frame_processed.connect(self._on_frame_processed, Qt.QueuedConnection)
+        self.predict_stream_finished.connect(self._on_predict_stream_finished, Qt.QueuedConnection)
+        self.log_export_finished.connect(self.display_message, Qt.QueuedConnection)
+        self.frame_update_timer = QTimer(self)
+        self.frame_update_timer.timeout.connect(self._apply_pending_frame_update)
+        self.frame_update_timer.start(self.FRAME_UPDATE_INTERVAL_MS)
+
+        # ROI preview redraws are coalesced so a burst of selections renders only the last one
+        self._pending_roi_preview = None
+        self._roi_preview_timer = QTimer(self)
+        self._roi_preview_timer.setSingleShot(True)
+        self._roi_preview_timer.setInterval(self.ROI_PREVIEW_DEBOUNCE_MS)
+        self._roi_preview_timer.timeout.connect(self._apply_pending_roi_preview)
+
+        # ROI edits are written to disk once per burst; explicit saves and closing flush immediately
+        self._roi_dirty = False
+        self._roi_save_timer = QTimer(self)
+        self._roi_save_timer.setSingleShot(True)
+        self._roi_save_timer.setInterval(self.ROI_SAVE_DEBOUNCE_MS)
+        self._roi_save_timer.timeout.connect(self._flush_roi_config)
 
         # Initialize ROI configuration UI
         self.update_roi_list()
@@ -436,6 +1057,8 @@ class WoodSortingApp(QMainWindow):
         grade_stats_layout.setSpacing(10)
 
         # Grade labels with enhanced styling
+        self._grade_count_labels = []
+        self._grade_percentage_labels = []
         for i in range(4):
             grade_label = QLabel(f"Grade {i}")
             grade_label.setStyleSheet("font-size: 16px; font-weight: bold;")
@@ -445,12 +1068,14 @@ class WoodSortingApp(QMainWindow):
             count_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #333;")
             count_label.setAlignment(Qt.AlignCenter)
             setattr(self, f"grade_{i}_count", count_label)
+            self._grade_count_labels.append(count_label)
             grade_stats_layout.addWidget(count_label, i, 1)
             
             percentage_label = QLabel("0%")
             percentage_label.setStyleSheet("font-size: 14px; color: #666;")
             percentage_label.setAlignment(Qt.AlignCenter)
             setattr(self, f"grade_{i}_percentage", percentage_label)
+            self._grade_percentage_labels.append(percentage_label)
             grade_stats_layout.addWidget(percentage_label, i, 2)
 
         grade_summary_layout.addWidget(grade_stats_frame)
@@ -572,18 +1197,18 @@ class WoodSortingApp(QMainWindow):
         camera_grid_layout.addWidget(QLabel("Top Camera"), 1, 0)
         self.top_camera_health_status = QLabel("Unknown")
         camera_grid_layout.addWidget(self.top_camera_health_status, 1, 1)
-        self.top_camera_usage_count = QLabel("0")
+        self.top_camera_usage_count = QLabel("N/A")
         camera_grid_layout.addWidget(self.top_camera_usage_count, 1, 2)
-        self.top_camera_last_used = QLabel("Never")
+        self.top_camera_last_used = QLabel("N/A")
         camera_grid_layout.addWidget(self.top_camera_last_used, 1, 3)
 
         # Bottom Camera
         camera_grid_layout.addWidget(QLabel("Bottom Camera"), 2, 0)
         self.bottom_camera_health_status = QLabel("Unknown")
         camera_grid_layout.addWidget(self.bottom_camera_health_status, 2, 1)
-        self.bottom_camera_usage_count = QLabel("0")
+        self.bottom_camera_usage_count = QLabel("N/A")
         camera_grid_layout.addWidget(self.bottom_camera_usage_count, 2, 2)
-        self.bottom_camera_last_used = QLabel("Never")
+        self.bottom_camera_last_used = QLabel("N/A")
         camera_grid_layout.addWidget(self.bottom_camera_last_used, 2, 3)
 
         camera_status_layout.addLayout(camera_grid_layout)
@@ -747,9 +1372,11 @@ class WoodSortingApp(QMainWindow):
         roi_list_group = QGroupBox("ROI List")
         roi_list_layout = QVBoxLayout(roi_list_group)
 
-        self.roi_list_widget = QListWidget()
-        self.roi_list_widget.itemSelectionChanged.connect(self.on_roi_selected)
-        roi_list_layout.addWidget(self.roi_list_widget)
+        self.roi_list_model = ROIListModel(self)
+        self.roi_list_view = QListView()
+        self.roi_list_view.setModel(self.roi_list_model)
+        self.roi_list_view.selectionModel().selectionChanged.connect(self.on_roi_selected)
+        roi_list_layout.addWidget(self.roi_list_view)
 
         # ROI control buttons
         roi_buttons_layout = QHBoxLayout()
@@ -844,11 +1471,19 @@ class WoodSortingApp(QMainWindow):
         log_layout.setContentsMargins(15, 15, 15, 15)
 
         # Log display area
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(self.LOG_MAX_LINES)
         self.log_display.setStyleSheet("font-family: monospace; font-size: 11px; background-color: #f8f8f8;")
         log_layout.addWidget(self.log_display)
 
+        # display_message buffers lines; the timer starts on the first buffered line
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+
         # Log controls
         log_controls_layout = QHBoxLayout()
         btn_clear_log = QPushButton("Clear Log")
@@ -863,6 +1498,57 @@ class WoodSortingApp(QMainWindow):
         log_layout.addLayout(log_controls_layout)
         self.stats_notebook.addTab(log_widget, "System Log")
 
+    def setup_frame_render_workers(self):
+        """Create one background render worker per camera label"""
+        self._render_threads = []
+        self._render_workers = {}
+        self._render_pending = {}
+        self._render_frames = {}  # label -> frame its worker is reading, None when idle
+
+        for label_widget in (self.top_camera_label, self.bottom_camera_label):
+            thread = QThread(self)
+            worker = FrameRenderWorker(getattr(self.config.performance, 'use_opencl', False))
+            worker.moveToThread(thread)
+            worker.image_ready.connect(
+                lambda image, label=label_widget: self._on_frame_rendered(label, image)
+            )
+            worker.render_failed.connect(
+                lambda error, label=label_widget: self._on_frame_render_failed(label, error)
+            )
+            thread.start()
+
+            self._render_threads.append(thread)
+            self._render_workers[label_widget] = worker
+            self._render_pending[label_widget] = False
+            self._render_frames[label_widget] = None
+
+    def _on_frame_rendered(self, label_widget, image):
+        """Display a frame rendered by a FrameRenderWorker (runs on the GUI thread)"""
+        self._render_pending[label_widget] = False
+        self._render_frames[label_widget] = None
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            print("DEBUG: QPixmap is null")
+            return
+        label_widget.setPixmap(pixmap)
+
+    def _on_frame_render_failed(self, label_widget, error):
+        """Release a label whose frame could not be rendered so the next frame is accepted"""
+        self._render_pending[label_widget] = False
+        self._render_frames[label_widget] = None
+        log_warning(SystemComponent.GUI, f"Frame render failed: {error}")
+
+    def closeEvent(self, event):
+        """Flush pending ROI edits and stop background threads before the window closes"""
+        self._flush_roi_config()
+        if self.frame_grabber is not None:
+            self.frame_grabber.stop()
+        self.inference_worker.stop()
+        for thread in getattr(self, '_render_threads', []):
+            thread.quit()
+            thread.wait(1000)
+        super().closeEvent(event)
+
     def setup_dev_mode(self):
         if self.dev_mode:
             print("Running in Development Mode: Simulating camera feeds and data.")
@@ -881,8 +1567,8 @@ class WoodSortingApp(QMainWindow):
         h, w, _ = frame.shape
         annotated_frame = frame.copy()
         # Draw a dummy detection
-        cv2.rectangle(annotated_frame, (w//4, h//4), (w*3//4, h*3//4), (0, 255, 0), 2)
-        cv2.putText(annotated_frame, "Mock Defect", (w//4 + 10, h//4 + 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        cv2.rectangle(annotated_frame, (w//4, h//4), (w*3//4, h*3//4), COLOR_GREEN, 2)
+        cv2.putText(annotated_frame, "Mock Defect", (w//4 + 10, h//4 + 30), OVERLAY_FONT, 1, COLOR_GREEN, 2)
         return annotated_frame, {"mock_defect": 1}, [("mock_defect", 10.0, 5.0)]
 
     def _mock_detect_wood(self, frame):
@@ -892,8 +1578,6 @@ class WoodSortingApp(QMainWindow):
 
     def simulate_camera_feed(self):
         """Simulate camera feeds in development mode"""
-        import numpy as np
-        
         # Create mock images for top and bottom cameras
         height, width = 480, 640
         
@@ -901,40 +1585,128 @@ class WoodSortingApp(QMainWindow):
         top_image = np.random.randint(100, 200, (height, width, 3), dtype=np.uint8)
         # Add some wood-like texture
         cv2.rectangle(top_image, (50, 100), (590, 380), (139, 69, 19), -1)  # Brown wood color
-        cv2.putText(top_image, "TOP CAMERA - MOCK FEED", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        cv2.putText(top_image, "TOP CAMERA - MOCK FEED", (50, 50), OVERLAY_FONT, 1, COLOR_WHITE, 2)
         
         # Bottom camera - create another mock wood piece image
         bottom_image = np.random.randint(80, 180, (height, width, 3), dtype=np.uint8)
         cv2.rectangle(bottom_image, (60, 120), (580, 360), (101, 67, 33), -1)  # Different brown
-        cv2.putText(bottom_image, "BOTTOM CAMERA - MOCK FEED", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        cv2.putText(bottom_image, "BOTTOM CAMERA - MOCK FEED", (50, 50), OVERLAY_FONT, 1, COLOR_WHITE, 2)
         
-        # Store mock frames
+        # Store mock frames; they are never drawn on, overlays go onto the scratch copies.
+        # Two scratch buffers per camera: one may still be read by the label's render worker.
         self.top_frame_original = top_image
         self.bottom_frame_original = bottom_image
+        self._dev_scratch = {
+            "top": (top_image.copy(), top_image.copy()),
+            "bottom": (bottom_image.copy(), bottom_image.copy()),
+        }
+
+    def _dev_frame(self, camera_name):
+        """Mock frame for this tick: the original when nothing draws on it, else a refreshed scratch buffer"""
+        original = self.top_frame_original if camera_name == "top" else self.bottom_frame_original
+        if original is None:
+            return None
+        if self.live_detection_var and not self.predict_stream_active and self._last_annotated_frames[camera_name] is not None:
+            return original  # A copy of the last detection result is shown and drawn on instead
+        # Never refresh the buffer the render worker is still converting
+        label_widget = self.top_camera_label if camera_name == "top" else self.bottom_camera_label
+        in_flight = self._render_frames.get(label_widget)
+        first, second = self._dev_scratch[camera_name]
+        scratch = second if first is in_flight else first
+        np.copyto(scratch, original)
+        return scratch
 
     def display_message(self, message, msg_type="info"):
         """Display message in the log with timestamp"""
-        timestamp = QDateTime.currentDateTime().toString('hh:mm:ss')
+        timestamp = time.strftime('%H:%M:%S')
         log_entry = f"[{timestamp}] {message}"
         
-        # Add to log display
+        # Add to log display (batched, see _flush_log_buffer)
         if hasattr(self, 'log_display'):
-            self.log_display.append(log_entry)
+            self._log_buffer.append(log_entry)
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
         
         # Print to console
         print(log_entry)
 
+    def _flush_log_buffer(self):
+        """Append all buffered log lines to the log tab in one call"""
+        if self._log_buffer:
+            self.log_display.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _detection_due(self, camera_name):
+        """Whether live detection should run on this tick's frame for camera_name.
+
+        Detection runs at most every LIVE_DETECTION_INTERVAL_S; in between,
+        update_feeds shows the last annotated frame. Claims the slot when due.
+        """
+        now = time.monotonic()
+        if now - self._last_detection_times[camera_name] >= self.LIVE_DETECTION_INTERVAL_S:
+            self._last_detection_times[camera_name] = now
+            return True
+        return False
+
+    def _live_detection_frame(self, camera_name, frame):
+        """Hand frame to the inference worker when detection is due; return the frame to show this tick"""
+        last_annotated = self._last_annotated_frames[camera_name]
+        if self._detection_due(camera_name):
+            # The worker keeps its frame past this tick: grabber ring slots get reused and, without an
+            # annotated frame yet, frame itself is drawn on. Only the immutable dev-mode original is shared.
+            shared = self.dev_mode and last_annotated is not None
+            self.inference_worker.submit(camera_name, frame if shared else frame.copy())
+        if last_annotated is None:
+            return frame
+        # Show the newest detection result; the copy takes this tick's ROI overlays
+        return last_annotated.copy()
+
+    def _on_detection_ready(self, camera_name, annotated_frame, defects, defect_list):
+        """Apply a live detection result from the inference worker (GUI thread)"""
+        self.current_defects[camera_name] = {"defects": defects, "defect_list": defect_list}
+        self._last_annotated_frames[camera_name] = annotated_frame
+
+        # Auto grade if enabled (combined with the other camera's results)
+        if self.auto_grade_var:
+            self.calculate_and_display_grade()
+
+        # Update model health tracking
+        if hasattr(self.detection_module, 'model_manager') and hasattr(self.detection_module.model_manager, 'health_monitor'):
+            # Track inference performance
+            inference_time = getattr(annotated_frame, 'inference_time', 100)  # Mock time if not available
+            success = len(defects) > 0 or True  # Assume success if we got results
+            self.detection_module.model_manager.health_monitor.track_inference("defect_detector", inference_time, success)
+
+    def _on_detection_failed(self, camera_name, error):
+        """Report a live detection error from the inference worker (GUI thread)"""
+        self.display_message(f"Detection error on {camera_name} camera: {error}", "error")
+
     def update_feeds(self):
+        """Run one feed tick; stretch the timer interval while ticks overrun it"""
+        start = time.perf_counter()
+        self._process_feeds()
+        work_ms = (time.perf_counter() - start) * 1000
+
+        if self.performance_monitor:
+            self.performance_monitor.record_component_time('gui_update', work_ms)
+
+        # setInterval restarts the timer, so only call it when the interval changes
+        interval = max(self._feed_interval_ms, int(work_ms * self.FEED_OVERRUN_FACTOR))
+        if self.timer.isActive() and interval != self.timer.interval():
+            self.timer.setInterval(interval)
+
+    def _process_feeds(self):
         """Update camera feeds and process detection"""
         try:
-            print(f"DEBUG: update_feeds called - live_detection_var: {self.live_detection_var}")
             # Get frames from cameras or use mock frames in dev mode
             if self.dev_mode:
-                top_frame = self.top_frame_original.copy() if self.top_frame_original is not None else None
-                bottom_frame = self.bottom_frame_original.copy() if self.bottom_frame_original is not None else None
+                top_frame = self._dev_frame("top")
+                bottom_frame = self._dev_frame("bottom")
             else:
-                top_frame = self.camera_module.get_top_frame()
-                bottom_frame = self.camera_module.get_bottom_frame()
+                latest = self.frame_grabber.get_latest()
+                if latest is None:
+                    return  # No new frames since the last tick
+                top_frame, bottom_frame = latest
 
             # Update camera status
             self.update_camera_status("top", top_frame is not None)
@@ -950,31 +1722,9 @@ class WoodSortingApp(QMainWindow):
                 else:
                     # Run detection if live detection is enabled AND predict_stream is not active
                     if self.live_detection_var and not self.predict_stream_active:
-                        try:
-                            print(f"DEBUG: GUI calling detection_module.analyze_frame for top camera")
-                            annotated_frame, defects, defect_list, alignment_result = self.detection_module.analyze_frame(top_frame, "top")
-                            print(f"DEBUG: GUI received result from detection_module.analyze_frame for top camera")
-                            self.current_defects["top"] = {"defects": defects, "defect_list": defect_list}
-
-                            # Auto grade if enabled
-                            if self.auto_grade_var:
-                                self.calculate_and_display_grade()
-
-                            # Update model health tracking
-                            if hasattr(self.detection_module, 'model_manager') and hasattr(self.detection_module.model_manager, 'health_monitor'):
-                                # Track inference performance
-                                inference_time = getattr(annotated_frame, 'inference_time', 100)  # Mock time if not available
-                                success = len(defects) > 0 or True  # Assume success if we got results
-                                self.detection_module.model_manager.health_monitor.track_inference("defect_detector", inference_time, success)
-                        except Exception as e:
-                            self.display_message(f"Detection error on top camera: {str(e)}", "error")
-                            print(f"DEBUG: Exception in GUI top camera detection: {str(e)}")
-                            import traceback
-                            traceback.print_exc()
-                            annotated_frame = top_frame
+                        annotated_frame = self._live_detection_frame("top", top_frame)
                     elif self.predict_stream_active:
                         # When predict_stream is active, use the latest annotated frame from predict_stream
-                        print(f"DEBUG: Predict stream active, using latest annotated frame for top camera")
                         if self.latest_annotated_frame is not None:
                             annotated_frame = self.latest_annotated_frame
                         else:
@@ -1015,19 +1765,20 @@ class WoodSortingApp(QMainWindow):
                             self.update_system_status("Status: Wood detected in ROI - collecting defect data...")
 
                         # Visual feedback for ROI and wood detection status
-                        if self.roi_checkbox.isChecked():
+                        if self.roi_overlay_var:
                             # ROI overlays are already drawn by roi_module.process_frame
                             pass
 
-                        if self.wood_detection_checkbox.isChecked() and wood_detections:
+                        if self.show_wood_var and wood_detections:
                             # Wood detection overlays are already drawn by roi_module.process_frame
                             pass
 
-                        print(f"DEBUG: ROI processing complete - wood detections: {len(wood_detections)}, overlaps: {len(overlaps)}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("ROI processing complete - wood detections: %d, overlaps: %d",
+                                              len(wood_detections), len(overlaps))
 
                     except Exception as e:
                         self.display_message(f"Error in ROI-based detection system: {str(e)}", "warning")
-                        print(f"DEBUG: Exception in ROI system: {str(e)}")
 
                     # Convert and display
                     self.display_frame(annotated_frame, self.top_camera_label)
@@ -1040,28 +1791,7 @@ class WoodSortingApp(QMainWindow):
                 else:
                     # Run detection if live detection is enabled
                     if self.live_detection_var:
-                        try:
-                            print(f"DEBUG: GUI calling detection_module.analyze_frame for bottom camera")
-                            annotated_frame, defects, defect_list, alignment_result = self.detection_module.analyze_frame(bottom_frame, "bottom")
-                            print(f"DEBUG: GUI received result from detection_module.analyze_frame for bottom camera")
-                            self.current_defects["bottom"] = {"defects": defects, "defect_list": defect_list}
-
-                            # Auto grade if enabled (combined with top camera results)
-                            if self.auto_grade_var:
-                                self.calculate_and_display_grade()
-
-                            # Update model health tracking
-                            if hasattr(self.detection_module, 'model_manager') and hasattr(self.detection_module.model_manager, 'health_monitor'):
-                                # Track inference performance
-                                inference_time = getattr(annotated_frame, 'inference_time', 100)  # Mock time if not available
-                                success = len(defects) > 0 or True  # Assume success if we got results
-                                self.detection_module.model_manager.health_monitor.track_inference("defect_detector", inference_time, success)
-                        except Exception as e:
-                            self.display_message(f"Detection error on bottom camera: {str(e)}", "error")
-                            print(f"DEBUG: Exception in GUI bottom camera detection: {str(e)}")
-                            import traceback
-                            traceback.print_exc()
-                            annotated_frame = bottom_frame
+                        annotated_frame = self._live_detection_frame("bottom", bottom_frame)
                     else:
                         annotated_frame = bottom_frame
 
@@ -1098,24 +1828,25 @@ class WoodSortingApp(QMainWindow):
                             self.update_system_status("Status: Wood detected in ROI - collecting defect data...")
 
                         # Enhanced visual feedback for ROI and wood detection status
-                        if self.roi_checkbox.isChecked():
+                        if self.roi_overlay_var:
                             # ROI overlays are already drawn by roi_module.process_frame
                             # Add additional status information overlay
-                            self._add_roi_status_overlay(annotated_frame, camera_name, overlaps)
+                            self._add_roi_status_overlay(annotated_frame, "bottom", overlaps)
 
-                        if self.wood_detection_checkbox.isChecked() and wood_detections:
+                        if self.show_wood_var and wood_detections:
                             # Wood detection overlays are already drawn by roi_module.process_frame
                             # Add confidence score overlays
                             self._add_wood_detection_overlays(annotated_frame, wood_detections)
 
                         # Update status displays with real-time information
-                        self.update_roi_status_display(camera_name, overlaps, wood_detections)
+                        self.update_roi_status_display("bottom", overlaps, wood_detections)
 
-                        print(f"DEBUG: ROI processing complete for bottom camera - wood detections: {len(wood_detections)}, overlaps: {len(overlaps)}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("ROI processing complete for bottom camera - wood detections: %d, overlaps: %d",
+                                              len(wood_detections), len(overlaps))
 
                     except Exception as e:
                         self.display_message(f"Error in ROI-based detection system (bottom): {str(e)}", "warning")
-                        print(f"DEBUG: Exception in ROI system (bottom): {str(e)}")
 
                     # Convert and display
                     self.display_frame(annotated_frame, self.bottom_camera_label)
@@ -1125,7 +1856,7 @@ class WoodSortingApp(QMainWindow):
 
             # Update model health and camera status (every 5 seconds)
             current_time = time.time()
-            if not hasattr(self, '_last_health_update') or current_time - self._last_health_update > 5.0:
+            if current_time - self._last_health_update > 5.0:
                 self.update_model_health_display()
                 self.update_camera_status_display()
                 self._last_health_update = current_time
@@ -1138,129 +1869,65 @@ class WoodSortingApp(QMainWindow):
 
     def _validate_frame(self, frame):
         """Validate frame data to prevent processing corrupted frames."""
-        try:
-            # Check if frame is None
-            if frame is None:
-                return False
-
-            # Check if frame has valid shape
-            if not hasattr(frame, 'shape') or len(frame.shape) != 3:
-                return False
-
-            # Check dimensions
-            height, width, channels = frame.shape
-            if height <= 0 or width <= 0 or channels not in [1, 3, 4]:
-                return False
-
-            # Check reasonable size limits (prevent extremely large frames)
-            if width > 4096 or height > 4096 or width < 16 or height < 16:
-                return False
-
-            # Check data type
-            if hasattr(frame, 'dtype') and frame.dtype != 'uint8':
-                return False
-
-            # Check if frame data is accessible and contiguous
-            try:
-                # Try to access a small portion of the frame
-                _ = frame[0:1, 0:1]
-                # Check if frame is contiguous in memory
-                if not frame.flags['C_CONTIGUOUS']:
-                    # Try to make it contiguous
-                    frame = frame.copy()
-                    _ = frame[0:1, 0:1]
-            except:
-                return False
-
-            # Additional validation for OpenCV matrix operations
-            try:
-                # Test basic OpenCV operations that might fail
-                import cv2
-                # Test color conversion (this often fails with corrupted frames)
-                if channels == 3:
-                    test_frame = cv2.cvtColor(frame[0:10, 0:10], cv2.COLOR_BGR2RGB)
-                    if test_frame.shape != (10, 10, 3):
-                        return False
-            except:
-                return False
-
-            return True
-
-        except Exception as e:
-            self.display_message(f"Frame validation failed: {str(e)}", "warning")
-            return False
+        return _is_valid_frame_fast(frame)
 
     def display_frame(self, frame, label_widget):
-        """Convert OpenCV frame to QPixmap and display in label"""
+        """Hand an OpenCV frame to the label's render worker for conversion and display"""
         if frame is not None:
             try:
-                print(f"DEBUG: Displaying frame with shape: {frame.shape}, dtype: {frame.dtype}")
-
                 # Check if frame has valid data
                 if frame.size == 0:
                     print("DEBUG: Frame has zero size")
                     return
 
-                # Ensure frame is in correct format
-                if len(frame.shape) == 3 and frame.shape[2] == 3:
-                    rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                else:
-                    print(f"DEBUG: Frame has unexpected shape: {frame.shape}")
-                    rgb_image = frame
-
-                h, w = rgb_image.shape[:2]
-                ch = rgb_image.shape[2] if len(rgb_image.shape) > 2 else 1
-
-                print(f"DEBUG: RGB image shape: {rgb_image.shape}, channels: {ch}")
-
-                if ch == 3:
-                    bytes_per_line = ch * w
-                    qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                elif ch == 1:
-                    bytes_per_line = w
-                    qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_Grayscale8)
-                else:
-                    print(f"DEBUG: Unsupported number of channels: {ch}")
-                    return
-
-                if qt_image.isNull():
-                    print("DEBUG: QImage is null")
+                worker = self._render_workers.get(label_widget)
+                if worker is None:
+                    print("DEBUG: No render worker for label")
                     return
 
-                # Scale image to fit label while maintaining aspect ratio
-                pixmap = QPixmap.fromImage(qt_image)
-                if pixmap.isNull():
-                    print("DEBUG: QPixmap is null")
+                # Drop the frame if the previous one for this label is still being rendered
+                if self._render_pending[label_widget]:
                     return
 
-                scaled_pixmap = pixmap.scaled(label_widget.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                if scaled_pixmap.isNull():
-                    print("DEBUG: Scaled QPixmap is null")
-                    return
-
-                label_widget.setPixmap(scaled_pixmap)
-                print(f"DEBUG: Successfully set pixmap on label")
+                self._render_pending[label_widget] = True
+                self._render_frames[label_widget] = frame
+                worker.render_requested.emit(frame, label_widget.size())
             except Exception as e:
+                self._render_pending[label_widget] = False
+                self._render_frames[label_widget] = None
                 self.display_message(f"Error displaying frame: {str(e)}", "error")
                 print(f"DEBUG: Exception in display_frame: {str(e)}")
-                import traceback
                 traceback.print_exc()
                 # Clear the label on error
                 label_widget.clear()
         else:
             print("DEBUG: Frame is None")
 
+    def _set_text(self, widget, text):
+        """Set widget text only if it differs from the last value set through this helper"""
+        key = (widget, 'text')
+        if self._last_widget_values.get(key) != text:
+            widget.setText(text)
+            self._last_widget_values[key] = text
+
+    def _set_style(self, widget, style):
+        """Set widget stylesheet only if it differs from the last value set through this helper"""
+        key = (widget, 'style')
+        if self._last_widget_values.get(key) != style:
+            widget.setStyleSheet(style)
+            self._last_widget_values[key] = style
+
     def update_camera_status(self, camera_name, is_available):
         """Update camera status display"""
         status_text = "Connected" if is_available else "Disconnected"
-        color = "green" if is_available else "red"
+        style = self._camera_status_stylesheets[bool(is_available)]
         
         if camera_name == "top":
-            self.top_camera_status.setText(f"Top Camera: {status_text}")
-            self.top_camera_status.setStyleSheet(f"font-size: 12px; color: {color};")
+            self._set_text(self.top_camera_status, f"Top Camera: {status_text}")
+            self._set_style(self.top_camera_status, style)
         else:
-            self.bottom_camera_status.setText(f"Bottom Camera: {status_text}")
-            self.bottom_camera_status.setStyleSheet(f"font-size: 12px; color: {color};")
+            self._set_text(self.bottom_camera_status, f"Bottom Camera: {status_text}")
+            self._set_style(self.bottom_camera_status, style)
 
     def update_arduino_status(self):
         """Update Arduino connection status display with concise text"""
@@ -1270,6 +1937,12 @@ class WoodSortingApp(QMainWindow):
                 is_connected = status.get("connected", False)
                 port = status.get("port", "None")
 
+                # Nothing to do if the connection state is the same as last tick
+                state_key = (is_connected, port)
+                if state_key == self._last_arduino_state:
+                    return
+                self._last_arduino_state = state_key
+
                 # Make status text more concise
                 if is_connected:
                     # Extract just the port number for brevity
@@ -1281,9 +1954,8 @@ class WoodSortingApp(QMainWindow):
                 else:
                     status_text = "Arduino: ✗ Disconnected"
 
-                color = "green" if is_connected else "red"
-                self.arduino_status.setText(status_text)
-                self.arduino_status.setStyleSheet(f"font-size: 11px; color: {color}; font-weight: bold;")
+                self._set_text(self.arduino_status, status_text)
+                self._set_style(self.arduino_status, self._arduino_status_stylesheets[bool(is_connected)])
 
                 # Update system status if Arduino status changed (without redundant info)
                 if is_connected:
@@ -1291,46 +1963,41 @@ class WoodSortingApp(QMainWindow):
                 else:
                     self.update_system_status("Arduino offline - manual mode")
             else:
-                self.arduino_status.setText("Arduino: N/A")
-                self.arduino_status.setStyleSheet("font-size: 11px; color: orange; font-weight: bold;")
+                self._set_text(self.arduino_status, "Arduino: N/A")
+                self._set_style(self.arduino_status, self._arduino_status_stylesheets[None])
 
         except Exception as e:
+            self._last_arduino_state = None
             log_error(SystemComponent.GUI, f"Error updating Arduino status: {str(e)}", e)
-            self.arduino_status.setText("Arduino: Error")
-            self.arduino_status.setStyleSheet("font-size: 11px; color: red; font-weight: bold;")
+            self._set_text(self.arduino_status, "Arduino: Error")
+            self._set_style(self.arduino_status, self._arduino_status_stylesheets[False])
 
     def calculate_and_display_grade(self):
         """Calculate grade from current defects and display results"""
         try:
             # Prevent recursion during predict_stream analysis
-            if hasattr(self, 'predict_stream_active') and self.predict_stream_active:
+            if self.predict_stream_active:
                 # Only grade every few frames to avoid overwhelming
-                if not hasattr(self, '_last_grade_frame'):
-                    self._last_grade_frame = 0
-                current_frame = len(self.predict_stream_results) if hasattr(self, 'predict_stream_results') else 0
+                current_frame = self._frame_running_total
                 if current_frame - self._last_grade_frame < 5:
                     return  # Skip grading this frame
                 self._last_grade_frame = current_frame
 
             # Combine defects from both cameras
-            all_defects = {}
-            all_defect_lists = []
-            
-            for camera in ["top", "bottom"]:
-                if camera in self.current_defects:
-                    camera_defects = self.current_defects[camera]["defects"]
-                    camera_defect_list = self.current_defects[camera]["defect_list"]
-                    
-                    # Merge defect counts
-                    for defect_type, count in camera_defects.items():
-                        all_defects[defect_type] = all_defects.get(defect_type, 0) + count
-                    
-                    # Add defect details
-                    all_defect_lists.extend(camera_defect_list)
+            all_defects = Counter()
+            defect_list_sources = []
+
+            top_camera_defects = self.current_defects.get("top")
+            bottom_camera_defects = self.current_defects.get("bottom")
+
+            for camera_defects in (top_camera_defects, bottom_camera_defects):
+                if camera_defects:
+                    all_defects.update(camera_defects["defects"])
+                    defect_list_sources.append(camera_defects["defect_list"])
 
             # ✅ FIXED: Calculate separate grades for top and bottom cameras
-            top_defects = self.current_defects.get("top", {}).get("defects", {})
-            bottom_defects = self.current_defects.get("bottom", {}).get("defects", {})
+            top_defects = top_camera_defects["defects"] if top_camera_defects else {}
+            bottom_defects = bottom_camera_defects["defects"] if bottom_camera_defects else {}
 
             top_grade_info = calculate_grade(top_defects)
             bottom_grade_info = calculate_grade(bottom_defects)
@@ -1350,105 +2017,153 @@ class WoodSortingApp(QMainWindow):
             self.current_grade_info = {
                 'grade': final_grade,
                 'defects': all_defects,
-                'defect_list': all_defect_lists,
+                'defect_list_sources': defect_list_sources,
                 'top_grade_info': top_grade_info,
                 'bottom_grade_info': bottom_grade_info
             }
 
             # Update grade display
-            grade_color = get_grade_color(final_grade)
-            self.current_grade_label.setText(f"Final Grade: {final_grade}")
-            self.current_grade_label.setStyleSheet(f"""
-                font-size: 18px; font-weight: bold; padding: 10px;
-                border: 2px solid {grade_color}; border-radius: 5px;
-                background-color: {grade_color}20; color: {grade_color};
-            """)
+            self.display_final_grade(final_grade)
 
             # Update wood classification
             self.update_wood_classification()
 
-            # Update defect details - use top_grade_info as primary
-            self.update_defect_details(all_defects, all_defect_lists, top_grade_info)
+            # Update defect details - use top_grade_info as primary; the details need a sized list
+            self.update_defect_details(all_defects, list(itertools.chain.from_iterable(defect_list_sources)), top_grade_info)
 
             # Update detection state
             self.update_detection_state("Grading")
 
             # Send grade command to Arduino for automatic sorting
-            if self.arduino_module and self.arduino_module.is_connected():
-                try:
-                    success = self.arduino_module.send_grade_command(final_grade)
-                    if success:
-                        self.update_system_status(f"✅ Grade {final_grade} sent to Arduino for sorting")
-                        log_info(SystemComponent.GUI, f"Successfully sent grade {final_grade} to Arduino")
-                    else:
-                        self.update_system_status(f"❌ Failed to send grade {final_grade} to Arduino")
-                        log_arduino_error(f"Failed to send grade {final_grade} to Arduino")
-                except Exception as e:
-                    self.update_system_status(f"❌ Error sending grade to Arduino: {str(e)}")
-                    log_arduino_error(f"Error sending grade {final_grade} to Arduino: {str(e)}", e)
-            else:
-                self.update_system_status(f"⚠️ Arduino not connected - Grade {final_grade} calculated but not sent")
-                log_warning(SystemComponent.GUI, f"Arduino not connected - cannot send grade {final_grade}")
+            self._send_grade_to_arduino(final_grade)
 
         except Exception as e:
             self.display_message(f"Error calculating grade: {str(e)}", "error")
 
+    @staticmethod
+    def _build_grade_stylesheet(grade):
+        """Build the current-grade label stylesheet for a grade"""
+        grade_color = get_grade_color(grade)
+        return f"""
+                font-size: 18px; font-weight: bold; padding: 10px;
+                border: 2px solid {grade_color}; border-radius: 5px;
+                background-color: {grade_color}20; color: {grade_color};
+            """
+
+    def _send_grade_to_arduino(self, grade):
+        """Send a grade to the Arduino for sorting and report the outcome"""
+        if not (self.arduino_module and self.arduino_module.is_connected()):
+            self.update_system_status(f"⚠️ Arduino not connected - Grade {grade} calculated but not sent")
+            log_warning(SystemComponent.GUI, f"Arduino not connected - cannot send grade {grade}")
+            return
+
+        try:
+            success = self.arduino_module.send_grade_command(grade)
+        except Exception as e:
+            error_text = str(e)
+            self.update_system_status(f"❌ Error sending grade to Arduino: {error_text}")
+            log_arduino_error(f"Error sending grade {grade} to Arduino: {error_text}", e)
+            return
+
+        if success:
+            # Success path runs for every graded piece - reuse the prebuilt messages
+            messages = self._grade_sent_messages.get(grade)
+            if messages is None:
+                messages = self._grade_sent_messages[grade] = self._build_grade_sent_messages(grade)
+            self.update_system_status(messages[0])
+            log_info(SystemComponent.GUI, messages[1])
+        else:
+            self.update_system_status(f"❌ Failed to send grade {grade} to Arduino")
+            log_arduino_error(f"Failed to send grade {grade} to Arduino")
+
+    @staticmethod
+    def _build_grade_sent_messages(grade):
+        """Build the (status, log) messages reported after a grade reaches the Arduino"""
+        return (f"✅ Grade {grade} sent to Arduino for sorting",
+                f"Successfully sent grade {grade} to Arduino")
+
+    def display_final_grade(self, grade):
+        """Show the final grade, skipping the label update if the grade hasn't changed"""
+        if grade == self._last_grade_shown:
+            return
+
+        stylesheet = self._grade_stylesheets.get(grade)
+        if stylesheet is None:
+            stylesheet = self._grade_stylesheets[grade] = self._build_grade_stylesheet(grade)
+
+        self.current_grade_label.setText(f"Final Grade: {grade}")
+        self.current_grade_label.setStyleSheet(stylesheet)
+        self._last_grade_shown = grade
+
     def update_roi_status_display(self, camera_name, overlaps, wood_detections):
         """Update ROI and wood detection status displays"""
         try:
             # Update ROI activity
-            active_rois = self.roi_module.roi_manager.get_active_rois(camera_name)
-            self.roi_activity_label.setText(f"Active ROIs: {len(active_rois)}")
+            active_rois = self._roi_manager.get_active_rois(camera_name)
+            self._set_text(self.roi_activity_label, f"Active ROIs: {len(active_rois)}")
 
             # Update overlap information
             total_overlaps = len(overlaps) if overlaps else 0
-            self.roi_overlap_label.setText(f"Overlaps: {total_overlaps}")
+            self._set_text(self.roi_overlap_label, f"Overlaps: {total_overlaps}")
 
             # Update session information
             if hasattr(self.roi_module, 'workflow_manager') and self.roi_module.workflow_manager:
                 active_sessions = len(self.roi_module.workflow_manager.get_active_sessions(camera_name))
-                self.roi_sessions_label.setText(f"Active Sessions: {active_sessions}")
+                self._set_text(self.roi_sessions_label, f"Active Sessions: {active_sessions}")
             else:
-                self.roi_sessions_label.setText("Active Sessions: N/A")
+                self._set_text(self.roi_sessions_label, "Active Sessions: N/A")
+
+            # Aggregate detection count and confidence in one pass
+            detection_count = 0
+            confidence_sum = 0.0
+            for detection in wood_detections or ():
+                if detection.detected:
+                    detection_count += 1
+                    confidence_sum += detection.confidence
 
             # Update wood detection information
-            detection_count = len([d for d in wood_detections if d.detected]) if wood_detections else 0
-            self.wood_detections_label.setText(f"Detections: {detection_count}")
+            self._set_text(self.wood_detections_label, f"Detections: {detection_count}")
 
             # Calculate average confidence
-            if wood_detections:
-                confidences = [d.confidence for d in wood_detections if d.detected]
-                avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-                self.wood_confidence_label.setText(f"Avg Confidence: {avg_confidence:.2f}")
-            else:
-                self.wood_confidence_label.setText("Avg Confidence: 0.00")
+            avg_confidence = confidence_sum / detection_count if detection_count else 0.0
+            self._set_text(self.wood_confidence_label, f"Avg Confidence: {avg_confidence:.2f}")
 
             # Update features information
             if wood_detections and wood_detections[0].detected:
                 features = wood_detections[0].features
                 if features and 'dominant_color' in features:
-                    self.wood_features_label.setText(f"Features: {features['dominant_color']}")
+                    self._set_text(self.wood_features_label, f"Features: {features['dominant_color']}")
                 else:
-                    self.wood_features_label.setText("Features: Basic")
+                    self._set_text(self.wood_features_label, "Features: Basic")
             else:
-                self.wood_features_label.setText("Features: None")
+                self._set_text(self.wood_features_label, "Features: None")
 
         except Exception as e:
             self.display_message(f"Error updating ROI status display: {str(e)}", "warning")
 
     def update_defect_details(self, defects, defect_list, grade_info):
         """Update the defect details display"""
-        details_text = "=== DEFECT ANALYSIS ===\n\n"
+        # setPlainText relayouts the whole document - skip it when the inputs haven't changed.
+        # The defect list is only compared by length; its entries follow the defect counts.
+        signature = (
+            tuple(sorted(defects.items())) if defects else (),
+            len(defect_list) if defect_list else 0,
+            tuple(grade_info.items()) if isinstance(grade_info, dict) else grade_info
+        )
+        if signature == self._last_defect_details_sig:
+            return
+        self._last_defect_details_sig = signature
+
+        parts = ["=== DEFECT ANALYSIS ===\n\n"]
 
         # Defect summary
         if defects:
-            details_text += "Defect Summary:\n"
-            for defect_type, count in defects.items():
-                details_text += f"• {defect_type}: {count}\n"
+            parts.append("Defect Summary:\n")
+            parts.append("".join(f"• {defect_type}: {count}\n" for defect_type, count in defects.items()))
         else:
-            details_text += "No defects detected.\n"
+            parts.append("No defects detected.\n")
 
-        details_text += "\n=== GRADE CALCULATION ===\n\n"
+        parts.append("\n=== GRADE CALCULATION ===\n\n")
 
         # Grade breakdown - handle both old and new formats
         if grade_info:
@@ -1458,45 +2173,51 @@ class WoodSortingApp(QMainWindow):
                 for grade, criteria in grade_info.items():
                     if isinstance(criteria, dict) and 'meets_criteria' in criteria:
                         if criteria['meets_criteria']:
-                            details_text += f"✓ Grade {grade}: MEETS CRITERIA\n"
-                            details_text += f"  Max defects allowed: {criteria.get('max_defects', 'N/A')}\n"
-                            details_text += f"  Current defects: {criteria.get('current_defects', 'N/A')}\n\n"
+                            parts.append(f"✓ Grade {grade}: MEETS CRITERIA\n")
                         else:
-                            details_text += f"✗ Grade {grade}: EXCEEDS LIMITS\n"
-                            details_text += f"  Max defects allowed: {criteria.get('max_defects', 'N/A')}\n"
-                            details_text += f"  Current defects: {criteria.get('current_defects', 'N/A')}\n\n"
+                            parts.append(f"✗ Grade {grade}: EXCEEDS LIMITS\n")
+                        parts.append(f"  Max defects allowed: {criteria.get('max_defects', 'N/A')}\n")
+                        parts.append(f"  Current defects: {criteria.get('current_defects', 'N/A')}\n\n")
                     else:
-                        details_text += f"Grade {grade}: {criteria}\n"
+                        parts.append(f"Grade {grade}: {criteria}\n")
             else:
                 # Old format or other structure
-                details_text += f"Grade Information: {grade_info}\n"
+                parts.append(f"Grade Information: {grade_info}\n")
 
         # Detailed defect list
         if defect_list:
-            details_text += "=== DETAILED DEFECTS ===\n\n"
-            for i, (defect_type, x, y) in enumerate(defect_list, 1):
-                details_text += f"{i}. {defect_type} at ({x:.1f}, {y:.1f})\n"
+            parts.append("=== DETAILED DEFECTS ===\n\n")
+            parts.append("\n".join(
+                f"{i}. {defect_type} at ({x:.1f}, {y:.1f})" for i, (defect_type, x, y) in enumerate(defect_list, 1)
+            ))
+            parts.append("\n")
 
+        details_text = "".join(parts)
         self.defect_details_text.setPlainText(details_text)
 
     def update_session_duration(self):
         """Update session duration display"""
-        if hasattr(self, 'session_start_time'):
-            current_time = QDateTime.currentMSecsSinceEpoch() / 1000
-            duration_seconds = int(current_time - self.session_start_time)
-            
-            hours = duration_seconds // 3600
-            minutes = (duration_seconds % 3600) // 60
-            seconds = duration_seconds % 60
+        if self.session_start_time is not None:
+            duration_seconds = int(time.monotonic() - self.session_start_monotonic)
+            # Called every feed tick; the label only changes once per second
+            if duration_seconds == self._last_session_seconds:
+                return
+            self._last_session_seconds = duration_seconds
+
+            hours, remainder = divmod(duration_seconds, 3600)
+            minutes, seconds = divmod(remainder, 60)
             
             duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            self.session_duration_label.setText(duration_str)
+            self._set_text(self.session_duration_label, duration_str)
 
     def process_message_queue(self):
-        """Process messages from Arduino module"""
+        """Process up to MAX_MESSAGES_PER_TICK messages from Arduino module"""
         try:
-            while not self.message_queue.empty():
-                message = self.message_queue.get_nowait()
+            for _ in range(self.MAX_MESSAGES_PER_TICK):
+                try:
+                    message = self.message_queue.get_nowait()
+                except queue.Empty:
+                    break
                 self.handle_arduino_message(message)
         except:
             pass
@@ -1513,26 +2234,11 @@ class WoodSortingApp(QMainWindow):
                 log_info(SystemComponent.GUI, f"Arduino message received: {actual_message}")
 
             # LEGACY IR SUPPORT: Keep IR beam messages for backward compatibility
-            if actual_message == "B":
-                # IR beam broken - start wood detection workflow (legacy support)
-                log_info(SystemComponent.GUI, "Legacy IR beam broken message received - ignoring (ROI-based system active)")
-                self.update_system_status("Status: Legacy IR message received - using ROI-based detection")
-            elif actual_message == "IR: 0" or actual_message == "IR:0":
-                # IR beam broken - start wood detection workflow (legacy support)
-                log_info(SystemComponent.GUI, "Legacy IR beam broken message received - ignoring (ROI-based system active)")
-                self.update_system_status("Status: Legacy IR message received - using ROI-based detection")
-            elif actual_message == "IR: 1" or actual_message == "IR:1":
-                # IR beam cleared - stop detection and process grading (legacy support)
-                log_info(SystemComponent.GUI, "Legacy IR beam cleared message received - ignoring (ROI-based system active)")
-                self.update_system_status("Status: Legacy IR message received - using ROI-based detection")
+            handler = self._arduino_handlers.get(actual_message)
+            if handler:
+                handler()
             elif actual_message.startswith("L:"):
-                # Length measurement received (legacy support)
-                try:
-                    duration_ms = int(actual_message.split(":")[1])
-                    log_info(SystemComponent.GUI, f"Legacy length measurement received: {duration_ms}ms - ignoring (ROI-based system active)")
-                    self.update_system_status(f"Status: Legacy length measurement received - using ROI-based detection")
-                except (ValueError, IndexError) as e:
-                    log_error(SystemComponent.GUI, f"Invalid length message format: {actual_message}", e)
+                self._handle_legacy_length(actual_message)
             else:
                 # Other Arduino messages (status updates, etc.)
                 self.update_system_status(f"Arduino: {actual_message}")
@@ -1540,6 +2246,25 @@ class WoodSortingApp(QMainWindow):
         except Exception as e:
             log_error(SystemComponent.GUI, f"Error handling Arduino message '{message}': {str(e)}", e)
 
+    def _handle_legacy_ir_broken(self):
+        """IR beam broken - start wood detection workflow (legacy support)"""
+        log_info(SystemComponent.GUI, "Legacy IR beam broken message received - ignoring (ROI-based system active)")
+        self.update_system_status("Status: Legacy IR message received - using ROI-based detection")
+
+    def _handle_legacy_ir_cleared(self):
+        """IR beam cleared - stop detection and process grading (legacy support)"""
+        log_info(SystemComponent.GUI, "Legacy IR beam cleared message received - ignoring (ROI-based system active)")
+        self.update_system_status("Status: Legacy IR message received - using ROI-based detection")
+
+    def _handle_legacy_length(self, actual_message):
+        """Length measurement received (legacy support)"""
+        try:
+            duration_ms = int(actual_message.split(":")[1])
+            log_info(SystemComponent.GUI, f"Legacy length measurement received: {duration_ms}ms - ignoring (ROI-based system active)")
+            self.update_system_status(f"Status: Legacy length measurement received - using ROI-based detection")
+        except (ValueError, IndexError) as e:
+            log_error(SystemComponent.GUI, f"Invalid length message format: {actual_message}", e)
+
     def handle_roi_wood_overlap(self, camera_name: str, wood_detections: list, overlapping_rois: list):
         """Handle wood-ROI overlap detection - start ROI-based workflow"""
         try:
@@ -1686,7 +2411,10 @@ class WoodSortingApp(QMainWindow):
             log_info(SystemComponent.GUI, "Starting enhanced predict_stream continuous inference")
 
             # Reset results collection and performance tracking
-            self.predict_stream_results = []
+            self.predict_stream_results = deque(maxlen=self.PREDICT_STREAM_RESULTS_MAXLEN)
+            self._frame_running_total = 0
+            self._defect_running_total = 0
+            self._defect_type_totals = Counter()
             self._inference_start_time = time.time()
             self._inference_frame_count = 0
             self._inference_error_count = 0
@@ -1695,6 +2423,7 @@ class WoodSortingApp(QMainWindow):
             self._pause_gui_camera_feed()
 
             # Start predict_stream in a separate thread with enhanced monitoring
+            self._predict_stream_stop.clear()
             self.predict_stream_active = True
             self.predict_stream_thread = threading.Thread(target=self._run_enhanced_predict_stream_inference)
             self.predict_stream_thread.daemon = True
@@ -1721,16 +2450,48 @@ class WoodSortingApp(QMainWindow):
                     self.gui = gui_instance
                     self.frame_count = 0
                     self.start_time = time.time()
+                    # Interval accounting uses integer monotonic nanoseconds
+                    self.start_ns = time.monotonic_ns()
                     self.error_count = 0
+                    self._last_log_ns = 0
+                    self._log_interval_ns = 1_000_000_000  # 1 s between progress log lines
+                    self.frame_done = threading.Event()  # set once analyze() has handled a frame
+                    # Inference metrics are handed to the health monitor in batches
+                    self._pending_times = []
+                    self._pending_success = 0
+                    self._last_flush_ns = self.start_ns
+                    # Which optional attributes the SDK result type carries, probed once per type
+                    self._result_type = None
+                    self._result_has_results = False
+                    self._result_has_time = False
+                    self._result_has_overlay = False
+
+                def flush_inference_metrics(self):
+                    """Send accumulated inference metrics to the health monitor"""
+                    if self._pending_times:
+                        self.gui.detection_module.model_manager.health_monitor.track_inference_batch(
+                            model_name, self._pending_times, self._pending_success
+                        )
+                    self._pending_times = []
+                    self._pending_success = 0
+                    self._last_flush_ns = time.monotonic_ns()
 
                 def analyze(self, result):
                     """Enhanced analyze method with performance tracking"""
                     try:
                         self.frame_count += 1
-                        current_time = time.time()
+                        now_ns = time.monotonic_ns()
+                        elapsed_ns = now_ns - self.start_ns
+
+                        # Results come from a single SDK type, so probe its attributes once
+                        if type(result) is not self._result_type:
+                            self._result_type = type(result)
+                            self._result_has_results = hasattr(result, 'results')
+                            self._result_has_time = hasattr(result, 'inference_time')
+                            self._result_has_overlay = hasattr(result, 'image_overlay')
 
                         # Process the inference result
-                        detections = result.results if hasattr(result, 'results') else []
+                        detections = result.results if self._result_has_results else ()
 
                         frame_defects = {}
                         frame_defect_measurements = []
@@ -1752,34 +2513,42 @@ class WoodSortingApp(QMainWindow):
                         frame_result = {
                             'frame_id': self.frame_count,
                             'defects': frame_defects,
-                            'timestamp': current_time,
-                            'processing_time': current_time - self.start_time
+                            'timestamp': self.start_time + elapsed_ns / 1e9,
+                            'processing_time': elapsed_ns / 1e9
                         }
 
-                        self.gui.predict_stream_results.append(frame_result)
+                        self.gui._record_predict_stream_frame(frame_result)
 
                         # Update GUI tracking variables
                         self.gui._inference_frame_count = self.frame_count
 
-                        # Store the annotated frame for GUI display
-                        if hasattr(result, 'image_overlay'):
-                            self.gui.latest_annotated_frame = result.image_overlay
-
                         # 4. Add health monitoring during inference sessions
                         # Track inference performance
-                        inference_time = getattr(result, 'inference_time', 50)  # Default 50ms
+                        inference_time = result.inference_time if self._result_has_time else 50  # Default 50ms
                         success = len(detections) > 0 or True  # Assume success if we got results
-                        self.gui.detection_module.model_manager.health_monitor.track_inference(
-                            model_name, inference_time, success
-                        )
-
-                        # Log progress with performance metrics
-                        fps = self.frame_count / (current_time - self.start_time) if (current_time - self.start_time) > 0 else 0
-                        print(f"Enhanced predict_stream: Frame {self.frame_count} - defects: {frame_defects}, FPS: {fps:.1f}")
-
-                        # Update system status with performance info
-                        if self.frame_count % 30 == 0:  # Update every 30 frames
-                            self.gui.update_system_status(f"Status: Processing frame {self.frame_count} - {len(frame_defects)} defects detected")
+                        self._pending_times.append(inference_time)
+                        if success:
+                            self._pending_success += 1
+                        if len(self._pending_times) >= 30 or now_ns - self._last_flush_ns >= 1_000_000_000:
+                            self.flush_inference_metrics()
+
+                        # Log progress with performance metrics (rate-limited, no per-frame I/O)
+                        if now_ns - self._last_log_ns >= self._log_interval_ns:
+                            self._last_log_ns = now_ns
+                            fps = self.frame_count * 1_000_000_000 / elapsed_ns if elapsed_ns > 0 else 0
+                            log_info(SystemComponent.GUI, f"Enhanced predict_stream: Frame {self.frame_count} - defects: {frame_defects}, FPS: {fps:.1f}")
+
+                        # Publish the annotated frame into the GUI's frame buffer
+                        image_overlay = result.image_overlay if self._result_has_overlay else None
+                        if image_overlay is not None:
+                            self.gui._publish_annotated_frame(image_overlay)
+
+                        # Hand status info to the GUI thread
+                        if self.frame_count % 30 == 0:  # Update status every 30 frames
+                            fps = self.frame_count * 1_000_000_000 / elapsed_ns if elapsed_ns > 0 else 0
+                            self.gui.frame_processed.emit({
+                                'status_text': f"Status: Processing frame {self.frame_count} - {len(frame_defects)} defects detected ({fps:.1f} FPS)"
+                            })
 
                     except Exception as e:
                         self.error_count += 1
@@ -1794,6 +2563,8 @@ class WoodSortingApp(QMainWindow):
                                 self.error_count = 0  # Reset error count
                             else:
                                 log_error(SystemComponent.GUI, "Model reload failed during inference")
+                    finally:
+                        self.frame_done.set()
 
             # Create analyzer instance
             analyzer = EnhancedDefectAnalyzer(self)
@@ -1830,57 +2601,161 @@ class WoodSortingApp(QMainWindow):
                     analyzers=[analyzer]
                 ):
                     # Check if we should stop
-                    if not self.predict_stream_active:
-                        log_info(SystemComponent.GUI, "Enhanced predict stream stopping due to flag")
+                    if self._predict_stream_stop.is_set():
+                        log_info(SystemComponent.GUI, "Enhanced predict stream stopping on stop request")
                         break
 
-                    # Small delay to prevent overwhelming the system
-                    time.sleep(0.01)
+                    # Pace on the analyzer finishing the frame instead of a fixed sleep
+                    analyzer.frame_done.wait(timeout=0.1)
+                    analyzer.frame_done.clear()
 
             except Exception as e:
                 log_error(SystemComponent.GUI, f"Error in enhanced predict_stream loop: {str(e)}", e)
 
                 # 6. Add automatic recovery mechanisms for workflow stability
-                if "timeout" in str(e).lower():
+                # Classify by exception type; only SDK errors that don't subclass the
+                # builtins fall back to a single scan of the message
+                if isinstance(e, TimeoutError):
+                    error_kind = "timeout"
+                elif isinstance(e, ConnectionError):
+                    error_kind = "connection"
+                else:
+                    message = str(e).lower()
+                    error_kind = next((token for token in self.RECOVERABLE_ERROR_TOKENS if token in message), None)
+
+                if error_kind == "timeout":
                     log_info(SystemComponent.GUI, "Timeout detected in predict_stream - attempting automatic recovery")
                     if self.detection_module.reload_model(model_name):
                         log_info(SystemComponent.GUI, "Model recovered from timeout")
                     else:
                         log_error(SystemComponent.GUI, "Model recovery from timeout failed")
-                elif "connection" in str(e).lower():
+                elif error_kind == "connection":
                     log_info(SystemComponent.GUI, "Connection error detected - attempting camera reconnection")
                     # The camera coordinator will handle reconnection automatically
 
+            # Don't lose the metrics of a partially filled batch
+            analyzer.flush_inference_metrics()
+
             log_info(SystemComponent.GUI, f"Enhanced predict stream stopped after {analyzer.frame_count} frames")
 
             # 5. Integrate performance tracking and reporting
-            end_time = time.time()
-            total_duration = end_time - self._inference_start_time
-            avg_fps = self._inference_frame_count / total_duration if total_duration > 0 else 0
-
-            performance_report = {
-                'total_frames': self._inference_frame_count,
-                'total_duration': total_duration,
-                'average_fps': avg_fps,
-                'total_errors': self._inference_error_count,
-                'error_rate': self._inference_error_count / self._inference_frame_count if self._inference_frame_count > 0 else 0
-            }
+            performance_report = self._build_performance_report()
 
             log_info(SystemComponent.GUI, f"Enhanced predict_stream performance: {performance_report}")
 
             # Update performance display
-            if hasattr(self, 'performance_monitor'):
-                self.performance_monitor.add_metric('predict_stream_fps', avg_fps)
+            if self.performance_monitor:
+                self.performance_monitor.add_metric('predict_stream_fps', performance_report['average_fps'])
                 self.performance_monitor.add_metric('predict_stream_errors', self._inference_error_count)
 
         except Exception as e:
             log_error(SystemComponent.GUI, f"Error in enhanced predict_stream thread: {str(e)}", e)
         finally:
             self.predict_stream_active = False
-            # Resume GUI camera feed
-            self._resume_gui_camera_feed()
-            # Reinitialize camera for GUI use
-            self._reinitialize_camera_after_predict_stream()
+            # Resume the GUI feed and reinitialize the camera on the GUI thread
+            self.predict_stream_finished.emit()
+
+    def _build_performance_report(self):
+        """Summarize the predict_stream session; repeated calls for the same session state share one report"""
+        report_key = (self._inference_start_time, self._inference_frame_count, self._inference_error_count)
+        if self._performance_report_key == report_key:
+            return self._performance_report
+
+        frame_count = self._inference_frame_count
+        error_count = self._inference_error_count
+        total_duration = time.time() - self._inference_start_time
+        self._performance_report = {
+            'total_frames': frame_count,
+            'total_duration': total_duration,
+            'average_fps': frame_count / total_duration if total_duration > 0 else 0,
+            'total_errors': error_count,
+            'error_rate': error_count / frame_count if frame_count > 0 else 0
+        }
+        self._performance_report_key = report_key
+        return self._performance_report
+
+    def _on_predict_stream_finished(self):
+        """Hand the camera back to the GUI once the predict_stream thread has exited"""
+        # Resume GUI camera feed
+        self._resume_gui_camera_feed()
+        # Reinitialize camera for GUI use
+        self._reinitialize_camera_after_predict_stream()
+
+    def _on_frame_processed(self, update):
+        """Queue the latest predict_stream update; intermediate frames are coalesced"""
+        status_text = update.get('status_text')
+        if status_text:
+            self._pending_status_text = status_text
+        if self._pending_frame_update is None:
+            self._pending_frame_update = update
+        else:
+            # Keep defects from an earlier frame if the newer update doesn't carry any
+            pending_defects = self._pending_frame_update.get('top_defects')
+            self._pending_frame_update = update
+            if pending_defects is not None and 'top_defects' not in update:
+                update['top_defects'] = pending_defects
+
+    def _apply_pending_frame_update(self):
+        """Apply the newest predict_stream update to GUI state at display rate"""
+        update = self._pending_frame_update
+        status_text = self._pending_status_text
+        self._pending_frame_update = None
+        self._pending_status_text = None
+
+        # Pick up the newest published frame, if any
+        if self._frame_seq != self._frame_seq_applied and self.predict_stream_active:
+            self._read_published_frame()
+
+        if update is not None:
+            top_defects = update.get('top_defects')
+            if top_defects is not None:
+                self.current_defects["top"] = top_defects
+                # Auto grade if enabled
+                if self.auto_grade_var:
+                    self.calculate_and_display_grade()
+
+        if status_text:
+            self.update_system_status(status_text)
+
+    def _read_published_frame(self):
+        """Copy the newest published frame out of its slot (GUI thread)
+
+        Once seq moves on, the writer reuses the slot just read. The copy is
+        only kept if seq is unchanged afterwards; otherwise it may be torn
+        and the read is retried against the newer frame.
+        """
+        for _ in range(self.FRAME_READ_RETRIES):
+            frame_seq = self._frame_seq
+            frame = self._frame_slots[frame_seq & 1].copy()
+            if self._frame_seq == frame_seq:
+                self.latest_annotated_frame = frame
+                self._frame_seq_applied = frame_seq
+                return
+
+    def _frame_back_buffer(self, like):
+        """Return the back buffer for the next published frame, sized like `like` (predict_stream thread)"""
+        slots = self._frame_slots
+        if slots is None or slots[0].shape != like.shape or slots[0].dtype != like.dtype:
+            slots = self._frame_slots = [np.empty_like(like), np.empty_like(like)]
+        return slots[(self._frame_seq + 1) & 1]
+
+    def _commit_frame_back_buffer(self):
+        """Publish the back buffer filled since the last _frame_back_buffer call (predict_stream thread)"""
+        self._frame_seq += 1
+
+    def _publish_annotated_frame(self, frame):
+        """Copy a predict_stream frame into the back buffer and publish it (predict_stream thread)"""
+        np.copyto(self._frame_back_buffer(frame), frame)
+        self._commit_frame_back_buffer()
+
+    def _record_predict_stream_frame(self, frame_result):
+        """Store a predict_stream frame result and update the session running totals"""
+        self.predict_stream_results.append(frame_result)
+        self._frame_running_total += 1
+        frame_defects = frame_result['defects']
+        if frame_defects:
+            self._defect_type_totals.update(frame_defects)
+            self._defect_running_total += sum(frame_defects.values())
 
     def _pause_gui_camera_feed(self):
         """Pause the GUI camera feed timer to avoid conflicts with predict_stream"""
@@ -1888,6 +2763,8 @@ class WoodSortingApp(QMainWindow):
             if hasattr(self, 'timer') and self.timer.isActive():
                 log_info(SystemComponent.GUI, "Pausing GUI camera feed for predict_stream")
                 self.timer.stop()
+                if self.frame_grabber is not None:
+                    self.frame_grabber.pause()
                 self._gui_feed_paused = True
         except Exception as e:
             log_warning(SystemComponent.GUI, f"Error pausing GUI camera feed: {str(e)}")
@@ -1895,9 +2772,12 @@ class WoodSortingApp(QMainWindow):
     def _resume_gui_camera_feed(self):
         """Resume the GUI camera feed timer after predict_stream stops"""
         try:
-            if hasattr(self, '_gui_feed_paused') and self._gui_feed_paused:
+            if self._gui_feed_paused:
                 log_info(SystemComponent.GUI, "Resuming GUI camera feed after predict_stream")
-                self.timer.start(100)  # Resume with 100ms interval
+                if self.frame_grabber is not None:
+                    self.frame_grabber.resume()
+                self._feed_interval_ms = 100
+                self.timer.start(self._feed_interval_ms)  # Resume with 100ms interval
                 self._gui_feed_paused = False
         except Exception as e:
             log_warning(SystemComponent.GUI, f"Error resuming GUI camera feed: {str(e)}")
@@ -1907,13 +2787,21 @@ class WoodSortingApp(QMainWindow):
         try:
             if not self.dev_mode and hasattr(self.camera_module, 'cap_top') and self.camera_module.cap_top is None:
                 log_info(SystemComponent.GUI, "Reinitializing camera for GUI use after predict_stream")
-                # Give predict_stream time to fully release the camera
-                time.sleep(0.5)
-                # Reinitialize the camera
-                self.camera_module.initialize_cameras()
+                # Give predict_stream time to fully release the camera without blocking the event loop
+                QTimer.singleShot(500, self._initialize_cameras_for_gui)
         except Exception as e:
             log_warning(SystemComponent.GUI, f"Error reinitializing camera: {str(e)}")
 
+    def _initialize_cameras_for_gui(self):
+        """Reopen the cameras with the frame grabber held off so it never reads a half-open capture"""
+        if self.frame_grabber is not None:
+            self.frame_grabber.pause()
+        try:
+            self.camera_module.initialize_cameras()
+        finally:
+            if self.frame_grabber is not None and not self._gui_feed_paused:
+                self.frame_grabber.resume()
+
     def _run_mock_predict_stream(self):
         """Run a mock predict_stream for testing when model is not available"""
         try:
@@ -1948,26 +2836,28 @@ class WoodSortingApp(QMainWindow):
                             'timestamp': time.time()
                         }
 
-                        self.gui.predict_stream_results.append(frame_result)
+                        self.gui._record_predict_stream_frame(frame_result)
 
-                        # Update current defects for grading
-                        self.gui.current_defects["top"] = {
-                            "defects": mock_defects,
-                            "defect_list": frame_defect_measurements
+                        # Current defects for grading; applied (and auto-graded) on the GUI thread
+                        update = {
+                            'top_defects': {
+                                "defects": mock_defects,
+                                "defect_list": frame_defect_measurements
+                            }
                         }
 
-                        # Store a mock annotated frame
-                        if self.gui.dev_mode and self.gui.top_frame_original is not None:
-                            mock_frame = self.gui.top_frame_original.copy()
+                        # Store a mock annotated frame, annotating straight into the publish buffer
+                        source_frame = self.gui.top_frame_original
+                        if self.gui.dev_mode and source_frame is not None:
+                            mock_frame = self.gui._frame_back_buffer(source_frame)
+                            np.copyto(mock_frame, source_frame)
                             # Add some mock annotations
                             if mock_defects:
                                 cv2.putText(mock_frame, f"Mock defects: {mock_defects}", (50, 50),
-                                          cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                            self.gui.latest_annotated_frame = mock_frame
+                                          OVERLAY_FONT, 1, COLOR_GREEN, 2)
+                            self.gui._commit_frame_back_buffer()
 
-                        # Auto grade if enabled
-                        if self.gui.auto_grade_var:
-                            self.gui.calculate_and_display_grade()
+                        self.gui.frame_processed.emit(update)
 
                         log_info(SystemComponent.GUI, f"Mock processed frame {self.frame_count} - defects: {mock_defects}")
 
@@ -1983,37 +2873,35 @@ class WoodSortingApp(QMainWindow):
 
             # Simulate predict_stream behavior
             frame_count = 0
-            while self.predict_stream_active:
+            mock_result = _MockResult()
+            stop_requested = self._predict_stream_stop
+            while not stop_requested.is_set():
                 try:
                     # Get frame from camera or mock
                     if self.dev_mode:
-                        frame = self.top_frame_original.copy() if self.top_frame_original is not None else None
+                        # Read-only here; the analyzer copies what it publishes
+                        frame = self.top_frame_original
                     else:
                         frame = self.camera_module.get_top_frame()
 
                     if frame is not None:
                         frame_count += 1
 
-                        # Create a mock result object
-                        class MockResult:
-                            def __init__(self, frame_data):
-                                self.results = []  # Mock empty results
-                                self.image_overlay = frame_data
-
-                        mock_result = MockResult(frame)
+                        # Reuse the mock result object for every frame
+                        mock_result.image_overlay = frame
 
                         # Process result with analyzer
                         analyzer.analyze(mock_result)
 
-                        # Small delay to prevent overwhelming the system
-                        time.sleep(0.1)
+                        # Small delay to prevent overwhelming the system; a stop request cuts it short
+                        stop_requested.wait(0.1)
 
                     else:
-                        time.sleep(0.5)  # Wait for frame if not available
+                        stop_requested.wait(0.5)  # Wait for frame if not available
 
                 except Exception as e:
                     log_error(SystemComponent.GUI, f"Error in mock predict_stream: {str(e)}", e)
-                    time.sleep(1)  # Wait before retrying
+                    stop_requested.wait(1)  # Wait before retrying
 
             log_info(SystemComponent.GUI, f"Mock predict stream stopped after {frame_count} frames")
 
@@ -2027,6 +2915,7 @@ class WoodSortingApp(QMainWindow):
         try:
             if self.predict_stream_active:
                 log_info(SystemComponent.GUI, "Stopping enhanced predict_stream inference")
+                self._predict_stream_stop.set()
                 self.predict_stream_active = False
 
                 # Wait for thread to finish
@@ -2037,23 +2926,16 @@ class WoodSortingApp(QMainWindow):
                 self.latest_annotated_frame = None  # Clear the latest frame
 
                 # 5. Integrate performance tracking and reporting
-                if hasattr(self, '_inference_start_time') and hasattr(self, '_inference_frame_count'):
-                    end_time = time.time()
-                    total_duration = end_time - self._inference_start_time
-                    avg_fps = self._inference_frame_count / total_duration if total_duration > 0 else 0
-
-                    performance_summary = {
-                        'session_duration': total_duration,
-                        'total_frames_processed': self._inference_frame_count,
-                        'average_fps': avg_fps,
-                        'total_errors': getattr(self, '_inference_error_count', 0),
-                        'error_rate': getattr(self, '_inference_error_count', 0) / self._inference_frame_count if self._inference_frame_count > 0 else 0
-                    }
+                if self._inference_start_time:
+                    # Reuses the thread's end-of-session report when it has already been built
+                    performance_summary = self._build_performance_report()
+                    total_duration = performance_summary['total_duration']
+                    avg_fps = performance_summary['average_fps']
 
                     log_info(SystemComponent.GUI, f"Enhanced predict_stream performance summary: {performance_summary}")
 
                     # Update performance monitor
-                    if hasattr(self, 'performance_monitor'):
+                    if self.performance_monitor:
                         self.performance_monitor.add_metric('predict_stream_session_duration', total_duration)
                         self.performance_monitor.add_metric('predict_stream_avg_fps', avg_fps)
                         self.performance_monitor.add_metric('predict_stream_error_rate', performance_summary['error_rate'])
@@ -2127,7 +3009,6 @@ class WoodSortingApp(QMainWindow):
             self.start_predict_stream_inference()
 
             # Initialize ROI session tracking
-            self.active_roi_sessions = getattr(self, 'active_roi_sessions', {})
             self.active_roi_sessions[camera_name] = {
                 'start_time': time.time(),
                 'wood_detections': wood_detections,
@@ -2149,8 +3030,7 @@ class WoodSortingApp(QMainWindow):
             self.stop_predict_stream_inference()
 
             # Clear ROI session tracking
-            if hasattr(self, 'active_roi_sessions'):
-                self.active_roi_sessions.pop(camera_name, None)
+            self.active_roi_sessions.pop(camera_name, None)
 
             log_info(SystemComponent.GUI, f"ROI-based workflow stopped for {camera_name}")
 
@@ -2164,47 +3044,26 @@ class WoodSortingApp(QMainWindow):
             total_defects = session_results.get('total_defects', {})
 
             # Convert to format expected by grading system
-            grading_defects = []
+            # Sized once up front, then each type's run is filled with one shared tuple
+            grading_defects = [None] * sum(total_defects.values())
+            start = 0
             for defect_type, count in total_defects.items():
                 # Add size information (use default if not available)
-                for _ in range(count):
-                    grading_defects.append((defect_type, 10.0, 5.0))  # Default size values
+                grading_defects[start:start + count] = ((defect_type, 10.0, 5.0),) * count  # Default size values
+                start += count
 
             # Perform grading
-            from modules.grading_module import determine_surface_grade
             grade = determine_surface_grade(grading_defects)
 
             # Update grade display
-            grade_color = get_grade_color(grade)
-            self.current_grade_label.setText(f"Final Grade: {grade}")
-            self.current_grade_label.setStyleSheet(f"""
-                font-size: 18px; font-weight: bold; padding: 10px;
-                border: 2px solid {grade_color}; border-radius: 5px;
-                background-color: {grade_color}20; color: {grade_color};
-            """)
+            self.display_final_grade(grade)
 
             # Send grade command to Arduino
-            if self.arduino_module and self.arduino_module.is_connected():
-                try:
-                    success = self.arduino_module.send_grade_command(grade)
-                    if success:
-                        self.update_system_status(f"✅ Grade {grade} sent to Arduino for sorting")
-                        log_info(SystemComponent.GUI, f"Successfully sent grade {grade} to Arduino")
-                    else:
-                        self.update_system_status(f"❌ Failed to send grade {grade} to Arduino")
-                        log_arduino_error(f"Failed to send grade {grade} to Arduino")
-                except Exception as e:
-                    self.update_system_status(f"❌ Error sending grade to Arduino: {str(e)}")
-                    log_arduino_error(f"Error sending grade {grade} to Arduino: {str(e)}", e)
-            else:
-                self.update_system_status(f"⚠️ Arduino not connected - Grade {grade} calculated but not sent")
-                log_warning(SystemComponent.GUI, f"Arduino not connected - cannot send grade {grade}")
+            self._send_grade_to_arduino(grade)
 
             # Update statistics
             if grade in self.grade_counts:
-                self.grade_counts[grade] += 1
-                self.live_stats[f"grade{grade}"] += 1
-                self.total_pieces_processed += 1
+                self._count_graded_piece(grade)
                 self.update_grade_counters()
 
         except Exception as e:
@@ -2217,11 +3076,12 @@ class WoodSortingApp(QMainWindow):
 
             # 5. Integrate performance tracking and reporting
             session_performance = {
-                'total_frames': len(self.predict_stream_results),
-                'session_duration': time.time() - getattr(self, '_inference_start_time', time.time()),
+                'total_frames': self._frame_running_total,
+                'session_duration': time.time() - self._inference_start_time if self._inference_start_time else 0.0,
                 'model_health_status': self.detection_module.get_model_health_status("defect_detector").value,
                 'camera_status': self.detection_module.get_camera_status("top").value,
-                'total_defects_detected': sum(sum(frame['defects'].values()) for frame in self.predict_stream_results),
+                'total_defects_detected': self._defect_running_total,
+                'defects_by_type': dict(self._defect_type_totals),
                 'average_defects_per_frame': 0
             }
 
@@ -2240,7 +3100,7 @@ class WoodSortingApp(QMainWindow):
             log_info(SystemComponent.GUI, f"Enhanced session performance: {session_performance}")
 
             # Update performance monitor with session data
-            if hasattr(self, 'performance_monitor'):
+            if self.performance_monitor:
                 for key, value in session_performance.items():
                     if isinstance(value, (int, float)):
                         self.performance_monitor.add_metric(f'session_{key}', value)
@@ -2249,9 +3109,7 @@ class WoodSortingApp(QMainWindow):
             if self.current_grade_info:
                 grade = self.current_grade_info['grade']
                 if grade in self.grade_counts:
-                    self.grade_counts[grade] += 1
-                    self.live_stats[f"grade{grade}"] += 1
-                    self.total_pieces_processed += 1
+                    self._count_graded_piece(grade)
 
                     # Update UI counters
                     self.update_grade_counters()
@@ -2283,17 +3141,28 @@ class WoodSortingApp(QMainWindow):
             log_error(SystemComponent.GUI, f"Error marking object cleared: {str(e)}", e)
 
     def update_performance_display(self, metrics):
-        """Update performance metrics display"""
+        """Update performance metrics display, at most once per PERFORMANCE_DISPLAY_INTERVAL_S"""
         if hasattr(self, 'performance_display'):
-            performance_text = "=== PERFORMANCE METRICS ===\n\n"
-            
-            for metric_name, metric_value in metrics.items():
+            now = time.time()
+            if now - self._last_performance_display < self.PERFORMANCE_DISPLAY_INTERVAL_S:
+                return
+            self._last_performance_display = now
+
+            # The monitor passes a PerformanceMetrics dataclass; other callers pass a dict
+            metric_items = metrics.items() if isinstance(metrics, dict) else vars(metrics).items()
+
+            lines = ["=== PERFORMANCE METRICS ===", ""]
+            for metric_name, metric_value in metric_items:
                 if isinstance(metric_value, float):
-                    performance_text += f"{metric_name}: {metric_value:.2f}\n"
+                    lines.append(f"{metric_name}: {metric_value:.2f}")
                 else:
-                    performance_text += f"{metric_name}: {metric_value}\n"
-            
-            self.performance_display.setPlainText(performance_text)
+                    lines.append(f"{metric_name}: {metric_value}")
+            performance_text = "\n".join(lines) + "\n"
+
+            key = (self.performance_display, 'text')
+            if self._last_widget_values.get(key) != performance_text:
+                self.performance_display.setPlainText(performance_text)
+                self._last_widget_values[key] = performance_text
 
     # Control Methods
     def set_continuous_mode(self):
@@ -2403,228 +3272,241 @@ class WoodSortingApp(QMainWindow):
 
     def toggle_roi(self, checked):
         """Toggle ROI selection"""
+        self.roi_overlay_var = checked
         roi_status = "Active" if checked else "Disabled"
         self.display_message(f"Top ROI {roi_status}")
 
     def toggle_wood_detection(self, checked):
         """Toggle wood detection visualization"""
+        self.show_wood_var = checked
         detection_status = "enabled" if checked else "disabled"
         self.display_message(f"Wood detection visualization {detection_status}")
 
+    @gui_safe("checking ROI intersection", default=False)
     def _check_wood_roi_intersection(self, wood_bbox, camera_name):
         """Check if wood bounding box intersects with any ROI (both top and bottom ROIs)"""
-        try:
-            if not wood_bbox:
-                return False
-
-            wx1, wy1, wx2, wy2 = wood_bbox
-            print(f"DEBUG: Checking ROI intersection for {camera_name} camera")
-            print(f"DEBUG: Wood bbox: [{wx1}, {wy1}, {wx2}, {wy2}]")
-
-            # Use hardcoded ROI coordinates based on the log output
-            # From log: "Top: (64,0) to (1216,108), Bottom: (64,612) to (1216,720)"
-            frame_height = 720
-            frame_width = 1280
-
-            # Check both ROIs regardless of camera
-            top_roi = (64, 0, 1216, 108)  # Top ROI: (64,0) to (1216,108)
-            bottom_roi = (64, 612, 1216, 720)  # Bottom ROI: (64,612) to (1216,720)
-
-            # Check intersection with top ROI
-            top_x_overlap = (wx1 < top_roi[2]) and (wx2 > top_roi[0])
-            top_y_overlap = (wy1 < top_roi[3]) and (wy2 > top_roi[1])
-            top_intersection = top_x_overlap and top_y_overlap
+        if not wood_bbox:
+            return False
 
-            # Check intersection with bottom ROI
-            bottom_x_overlap = (wx1 < bottom_roi[2]) and (wx2 > bottom_roi[0])
-            bottom_y_overlap = (wy1 < bottom_roi[3]) and (wy2 > bottom_roi[1])
-            bottom_intersection = bottom_x_overlap and bottom_y_overlap
+        # Check both ROIs regardless of camera in one broadcast: the overlap of the
+        # wood box with each ROI is non-empty when its bottom-right exceeds its top-left
+        wood = np.asarray(wood_bbox)
+        top_left = np.maximum(wood[:2], TOP_BOTTOM_ROIS[:, :2])
+        bottom_right = np.minimum(wood[2:], TOP_BOTTOM_ROIS[:, 2:])
+        roi_hits = (bottom_right > top_left).all(axis=1)
 
-            # Wood intersects ROI if it touches either top OR bottom ROI
-            intersection = top_intersection or bottom_intersection
+        # Wood intersects ROI if it touches either top OR bottom ROI
+        intersection = bool(roi_hits.any())
 
-            print(f"DEBUG: Top ROI: {top_roi} - X overlap: {top_x_overlap}, Y overlap: {top_y_overlap}, Intersection: {top_intersection}")
-            print(f"DEBUG: Bottom ROI: {bottom_roi} - X overlap: {bottom_x_overlap}, Y overlap: {bottom_y_overlap}, Intersection: {bottom_intersection}")
-            print(f"DEBUG: Overall ROI intersection result: {intersection}")
+        if self._roi_debug:
+            # One line per ROI_DEBUG_EVERY checks keeps stdout writes out of the per-frame cost
+            if self._roi_debug_counter % self.ROI_DEBUG_EVERY == 0:
+                print(f"DEBUG: ROI intersection for {camera_name} camera - wood bbox {list(wood_bbox)}, "
+                      f"top/bottom hits {roi_hits.tolist()}, result: {intersection}")
+            self._roi_debug_counter += 1
 
-            return intersection
+        return intersection
 
-        except Exception as e:
-            self.display_message(f"Error checking ROI intersection: {str(e)}", "warning")
-            print(f"DEBUG: Exception in ROI intersection check: {str(e)}")
-            return False
 
+    @gui_safe("adding ROI status overlay")
     def _add_roi_status_overlay(self, frame, camera_name, overlaps):
         """Add comprehensive ROI status overlay to frame"""
-        try:
-            height, width = frame.shape[:2]
+        height, width = frame.shape[:2]
 
-            # Get ROI information
-            active_rois = self.roi_module.roi_manager.get_active_rois(camera_name)
-            roi_states = self.roi_module.roi_manager.roi_states.get(camera_name, {})
-
-            # Add status bar at top of frame
-            status_bar_height = 40
-            status_bar = np.zeros((status_bar_height, width, 3), dtype=np.uint8)
-            status_bar[:] = [50, 50, 50]  # Dark gray background
+        # Get ROI information; the active list and configs only change with the ROI config version
+        roi_manager = self._roi_manager
+        cached = self._roi_overlay_cache.get(camera_name)
+        if cached is not None and cached[0] == roi_manager.version:
+            _, active_rois, roi_configs = cached
+        else:
+            active_rois = roi_manager.get_active_rois(camera_name)
+            roi_configs = [roi_manager.get_roi_config(camera_name, roi_id) for roi_id in active_rois]
+            self._roi_overlay_cache[camera_name] = (roi_manager.version, active_rois, roi_configs)
+        roi_states = roi_manager.roi_states.get(camera_name, {})
+
+        # Add status bar at top of frame; the rendered bar only changes with its text
+        status_bar_height = 40
+        overlap_count = len(overlaps) if overlaps else 0
+        status_bar_key = (width, self.current_mode, len(active_rois), overlap_count)
+        status_bar = self._status_bar_cache.get(status_bar_key)
+        if status_bar is None:
+            status_bar = np.full((status_bar_height, width, 3), 50, dtype=np.uint8)  # Dark gray background
 
             # Add status text
             status_text = f"ROI Status: {len(active_rois)} active"
             cv2.putText(status_bar, status_text, (10, 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                       OVERLAY_FONT, 0.7, COLOR_WHITE, 2)
 
             # Add overlap information
-            if overlaps:
-                overlap_text = f" | Overlaps: {len(overlaps)}"
+            if overlap_count:
+                overlap_text = f" | Overlaps: {overlap_count}"
                 cv2.putText(status_bar, overlap_text, (200, 25),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                           OVERLAY_FONT, 0.7, COLOR_GREEN, 2)
 
             # Add mode information
             mode_text = f" | Mode: {self.current_mode}"
             cv2.putText(status_bar, mode_text, (400, 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+                       OVERLAY_FONT, 0.7, COLOR_CYAN, 2)
 
-            # Overlay status bar on frame
-            frame[0:status_bar_height, :] = cv2.addWeighted(
-                frame[0:status_bar_height, :], 0.7, status_bar, 0.3, 0
-            )
+            if len(self._status_bar_cache) >= self.STATUS_BAR_CACHE_SIZE:
+                self._status_bar_cache.clear()
+            self._status_bar_cache[status_bar_key] = status_bar
 
-            # Add individual ROI status indicators
-            y_offset = height - 100
-            for i, roi_id in enumerate(active_rois):
-                roi_config = self.roi_module.roi_manager.get_roi_config(camera_name, roi_id)
-                if not roi_config:
-                    continue
+        # Overlay status bar on frame, blending in place
+        frame_top = frame[0:status_bar_height, :]
+        cv2.addWeighted(frame_top, 0.7, status_bar, 0.3, 0, dst=frame_top)
 
-                status = roi_states.get(roi_id, ROIStatus.INACTIVE)
-                color = {
-                    ROIStatus.ACTIVE: (0, 255, 0),
-                    ROIStatus.OVERLAPPING: (0, 165, 255),
-                    ROIStatus.INACTIVE: (128, 128, 128),
-                    ROIStatus.ERROR: (0, 0, 255)
-                }.get(status, (128, 128, 128))
-
-                # Draw status indicator
-                indicator_x = 10
-                indicator_y = y_offset - (i * 25)
-                cv2.circle(frame, (indicator_x, indicator_y), 8, color, -1)
-                cv2.circle(frame, (indicator_x, indicator_y), 8, (255, 255, 255), 2)
-
-                # Add ROI label
-                label = f"{roi_config.name}: {status.value}"
-                cv2.putText(frame, label, (25, indicator_y + 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        # Add individual ROI status indicators
+        y_offset = height - 100
+        indicator_x = 10
+        # Indicators stack upwards 25px apart, one slot per active ROI
+        for roi_id, roi_config, indicator_y in zip(active_rois, roi_configs, itertools.count(y_offset, -25)):
+            if not roi_config:
+                continue
 
-        except Exception as e:
-            self.display_message(f"Error adding ROI status overlay: {str(e)}", "warning")
+            status = roi_states.get(roi_id, ROIStatus.INACTIVE)
+            color = ROI_STATUS_COLORS.get(status, ROI_STATUS_DEFAULT_COLOR)
+
+            # Draw status indicator
+            cv2.circle(frame, (indicator_x, indicator_y), 8, color, -1)
+            cv2.circle(frame, (indicator_x, indicator_y), 8, COLOR_WHITE, 2)
 
+            # Add ROI label
+            label = f"{roi_config.name}: {ROI_STATUS_TEXT[status]}"
+            cv2.putText(frame, label, (25, indicator_y + 5),
+                       OVERLAY_FONT, 0.6, COLOR_WHITE, 2)
+
+
+    @gui_safe("adding wood detection overlays")
     def _add_wood_detection_overlays(self, frame, wood_detections):
         """Add enhanced wood detection overlays with confidence scores"""
-        try:
-            for i, detection in enumerate(wood_detections):
-                if not detection.detected:
-                    continue
+        # Group detections by confidence color in a single pass
+        boxes_by_color = {}
+        labels = []
+        for i, detection in enumerate(wood_detections):
+            if not detection.detected:
+                continue
+
+            confidence = detection.confidence
+            x1, y1, x2, y2 = detection.bbox
+
+            # Determine color based on confidence
+            if confidence >= 0.8:
+                color = WOOD_COLOR_HIGH_CONFIDENCE
+            elif confidence >= 0.6:
+                color = WOOD_COLOR_MEDIUM_CONFIDENCE
+            else:
+                color = WOOD_COLOR_LOW_CONFIDENCE
+
+            boxes_by_color.setdefault(color, []).append((x1, y1, x2, y2))
+            labels.append((i, detection, color))
+
+        for color, boxes in boxes_by_color.items():
+            boxes = np.asarray(boxes, dtype=np.int32)
+
+            # Draw enhanced bounding boxes; cv2.rectangle is a closed 4-point polyline,
+            # so all boxes of this color go in one call
+            cv2.polylines(frame, boxes[:, WOOD_BOX_POINT_INDEX], True, color, 3)
+
+            # Draw the four L-shaped corner markers of every box of this color in one call
+            corners = boxes[:, WOOD_CORNER_POINT_INDEX]
+            markers = (corners[:, :, None, :] + WOOD_CORNER_MARKER_OFFSETS).reshape(-1, 3, 2)
+            cv2.polylines(frame, markers, False, color, 2)
+
+        # Labels go on top of all boxes
+        put_text = cv2.putText
+        for i, detection, color in labels:
+            x1, y1 = detection.bbox[:2]
+            features = detection.features
+            if features is None:
+                features = _EMPTY_FEATURES
+
+            # Add confidence score
+            confidence_text = f"Wood {i+1}: {detection.confidence:.2f}"
+            put_text(frame, confidence_text, (x1 + 10, y1 + 30),
+                     OVERLAY_FONT, 0.8, color, 2)
+
+            # Add feature information if available
+            dominant_color = features.get('dominant_color')
+            if dominant_color:
+                put_text(frame, f"Color: {dominant_color}", (x1 + 10, y1 + 60),
+                         OVERLAY_FONT, 0.6, COLOR_WHITE, 1)
+
+            # Add area information if available
+            contour_data = features.get('contour_data')
+            area = contour_data.get('area') if contour_data else None
+            if area is not None:
+                put_text(frame, f"Area: {area:.0f}px²", (x1 + 10, y1 + 85),
+                         OVERLAY_FONT, 0.6, COLOR_WHITE, 1)
+
+
+    @gui_safe("adding misalignment indicators")
+    def _add_misalignment_indicators(self, frame):
+        """Add red border and 'Wood not aligned' text to frame
 
-                bbox = detection.bbox
-                confidence = detection.confidence
-                features = detection.features or {}
+        Currently unused: the alignment overlay in _process_feeds is commented out,
+        so the cached text rendering below only matters if that overlay returns.
+        """
+        height, width = frame.shape[:2]
 
-                x1, y1, x2, y2 = bbox
+        # Add red border around the entire frame
+        border_thickness = 8
+        cv2.rectangle(frame, (0, 0), (width-1, height-1), COLOR_RED, border_thickness)
 
-                # Determine color based on confidence
-                if confidence >= 0.8:
-                    color = (0, 255, 0)  # Green for high confidence
-                elif confidence >= 0.6:
-                    color = (0, 255, 255)  # Yellow for medium confidence
-                else:
-                    color = (0, 165, 255)  # Orange for low confidence
-
-                # Draw enhanced bounding box
-                cv2.rectangle(frame, (x1, y1), (x2, y2), color, 3)
-
-                # Draw corner markers
-                marker_size = 15
-                # Top-left
-                cv2.line(frame, (x1, y1), (x1 + marker_size, y1), color, 2)
-                cv2.line(frame, (x1, y1), (x1, y1 + marker_size), color, 2)
-                # Top-right
-                cv2.line(frame, (x2, y1), (x2 - marker_size, y1), color, 2)
-                cv2.line(frame, (x2, y1), (x2, y1 + marker_size), color, 2)
-                # Bottom-left
-                cv2.line(frame, (x1, y2), (x1 + marker_size, y2), color, 2)
-                cv2.line(frame, (x1, y2), (x1, y2 - marker_size), color, 2)
-                # Bottom-right
-                cv2.line(frame, (x2, y2), (x2 - marker_size, y2), color, 2)
-                cv2.line(frame, (x2, y2), (x2, y2 - marker_size), color, 2)
-
-                # Add confidence score
-                confidence_text = f"Wood {i+1}: {confidence:.2f}"
-                cv2.putText(frame, confidence_text, (x1 + 10, y1 + 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
-
-                # Add feature information if available
-                if features.get('dominant_color'):
-                    color_text = f"Color: {features['dominant_color']}"
-                    cv2.putText(frame, color_text, (x1 + 10, y1 + 60),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
-
-                # Add area information if available
-                if 'contour_data' in features and 'area' in features['contour_data']:
-                    area = features['contour_data']['area']
-                    area_text = f"Area: {area:.0f}px²"
-                    cv2.putText(frame, area_text, (x1 + 10, y1 + 85),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        # Add "Wood not aligned" text in the center, rasterized once per frame size
+        cached = self._misalign_cache.get((height, width))
+        if cached is None:
+            cached = self._render_misalignment_text(height, width)
+            if len(self._misalign_cache) >= 3:
+                self._misalign_cache.clear()
+            self._misalign_cache[(height, width)] = cached
 
-        except Exception as e:
-            self.display_message(f"Error adding wood detection overlays: {str(e)}", "warning")
+        (y1, y2, x1, x2), text_patch, text_mask = cached
+        np.copyto(frame[y1:y2, x1:x2], text_patch, where=text_mask)
 
-    def _add_misalignment_indicators(self, frame):
-        """Add red border and 'Wood not aligned' text to frame"""
-        try:
-            height, width = frame.shape[:2]
 
-            # Add red border around the entire frame
-            border_thickness = 8
-            cv2.rectangle(frame, (0, 0), (width-1, height-1), (0, 0, 255), border_thickness)
+    @staticmethod
+    def _render_misalignment_text(height, width):
+        """Render the outlined 'WOOD NOT ALIGNED' text for a frame size as a (region, patch, mask) triple"""
+        text = "WOOD NOT ALIGNED"
+        font = OVERLAY_FONT
+        font_scale = 2.0
+        font_thickness = 4
 
-            # Add "Wood not aligned" text in the center
-            text = "WOOD NOT ALIGNED"
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            font_scale = 2.0
-            font_thickness = 4
+        # Get text size
+        (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, font_thickness)
 
-            # Get text size
-            (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, font_thickness)
+        # Calculate text position (center of frame)
+        text_x = (width - text_width) // 2
+        text_y = (height + text_height) // 2
 
-            # Calculate text position (center of frame)
-            text_x = (width - text_width) // 2
-            text_y = (height + text_height) // 2
+        # Draw into a scratch canvas, tracking drawn pixels separately since the outline is black
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        mask = np.zeros((height, width), dtype=np.uint8)
 
-            # Add black outline for better visibility
-            cv2.putText(frame, text, (text_x-2, text_y-2), font, font_scale, (0, 0, 0), font_thickness + 2)
-            cv2.putText(frame, text, (text_x+2, text_y-2), font, font_scale, (0, 0, 0), font_thickness + 2)
-            cv2.putText(frame, text, (text_x-2, text_y+2), font, font_scale, (0, 0, 0), font_thickness + 2)
-            cv2.putText(frame, text, (text_x+2, text_y+2), font, font_scale, (0, 0, 0), font_thickness + 2)
+        # Add black outline for better visibility
+        for dx, dy in ((-2, -2), (2, -2), (-2, 2), (2, 2)):
+            cv2.putText(mask, text, (text_x+dx, text_y+dy), font, font_scale, 255, font_thickness + 2)
 
-            # Add red text
-            cv2.putText(frame, text, (text_x, text_y), font, font_scale, (0, 0, 255), font_thickness)
+        # Add red text
+        cv2.putText(canvas, text, (text_x, text_y), font, font_scale, COLOR_RED, font_thickness)
+        cv2.putText(mask, text, (text_x, text_y), font, font_scale, 255, font_thickness)
 
-        except Exception as e:
-            self.display_message(f"Error adding misalignment indicators: {str(e)}", "warning")
+        # Keep only the text's bounding box so each frame copies a small patch
+        x, y, w, h = cv2.boundingRect(mask)
+        region = (y, y + h, x, x + w)
+        return region, canvas[y:y+h, x:x+w].copy(), mask[y:y+h, x:x+w, None].astype(bool)
 
     def update_detection_state(self, state):
         """Update the detection state label"""
         try:
-            state_colors = {
-                "Waiting": "#666",
-                "Detecting": "#f39c12",
-                "Grading": "#27ae60",
-                "Processing": "#3498db"
-            }
-            color = state_colors.get(state, "#666")
-            self.detection_state_label.setText(f"State: {state}")
-            self.detection_state_label.setStyleSheet(f"font-size: 12px; color: {color}; font-weight: bold;")
+            if state == self.detection_state and self._detection_state_shown:
+                return
+            self._set_text(self.detection_state_label, f"State: {state}")
+            self._set_style(self.detection_state_label,
+                            DETECTION_STATE_STYLES.get(state, DETECTION_STATE_STYLES["Waiting"]))
             self.detection_state = state
+            self._detection_state_shown = True
         except Exception as e:
             log_error(SystemComponent.GUI, f"Error updating detection state: {str(e)}", e)
 
@@ -2676,26 +3558,25 @@ class WoodSortingApp(QMainWindow):
 
             # Wood classification rules based on defect patterns
             # These are simplified rules - in practice would use ML model
+            # Ratios are compared as count > ratio * total, which needs no zero-total guard
 
             # High knot density often indicates softwoods
             knot_count = defects.get('knot', 0)
-            knot_ratio = knot_count / total_defects if total_defects > 0 else 0
 
             # Crack patterns can indicate wood type
             crack_count = defects.get('crack', 0)
-            crack_ratio = crack_count / total_defects if total_defects > 0 else 0
 
             # Classification logic
-            if knot_ratio > 0.6:
+            if knot_count > 0.6 * total_defects:
                 # High knot ratio suggests softwoods
                 if total_defects > 10:
                     return "Pine"  # Pine often has many small knots
                 else:
                     return "Spruce"  # Spruce has fewer but distinctive knots
-            elif crack_ratio > 0.5:
+            elif crack_count > 0.5 * total_defects:
                 # High crack ratio suggests hardwoods that are prone to checking
                 return "Oak"  # Oak is prone to cracking
-            elif knot_ratio > 0.3:
+            elif knot_count > 0.3 * total_defects:
                 # Moderate knot ratio
                 if crack_count > knot_count:
                     return "Maple"  # Maple can have cracks and knots
@@ -2706,15 +3587,8 @@ class WoodSortingApp(QMainWindow):
                 return "Oak"  # High-quality oak
             else:
                 # Default classification based on most common defect
-                most_common_defect = max(defects, key=defects.get)
-                if most_common_defect == 'knot':
-                    return "Pine"
-                elif most_common_defect == 'crack':
-                    return "Oak"
-                elif most_common_defect == 'resin':
-                    return "Pine"
-                else:
-                    return "Maple"  # Default fallback
+                most_common_defect = max(defects.items(), key=itemgetter(1))[0]
+                return WOOD_TYPE_BY_DEFECT.get(most_common_defect, "Maple")  # Maple is the default fallback
 
         except Exception as e:
             print(f"Error in defect-based classification: {str(e)}")
@@ -2727,9 +3601,9 @@ class WoodSortingApp(QMainWindow):
             enhanced_status = status_text
 
             # Add model health info if available (keep it short)
-            if hasattr(self.detection_module, 'get_model_health_status'):
+            if self._get_model_health is not None:
                 try:
-                    model_health = self.detection_module.get_model_health_status()
+                    model_health = self._get_model_health()
                     # Use single letter for brevity
                     health_short = model_health.value[0].upper()  # H, D, U, or ?
                     enhanced_status += f" | M:{health_short}"
@@ -2737,13 +3611,13 @@ class WoodSortingApp(QMainWindow):
                     pass
 
             # Add camera status info if available (keep it very short)
-            if hasattr(self.detection_module, 'get_camera_status'):
+            if self._get_camera_status is not None:
                 try:
-                    top_status = self.detection_module.get_camera_status("top")
-                    bottom_status = self.detection_module.get_camera_status("bottom")
+                    top_status = self._get_camera_status("top")
+                    bottom_status = self._get_camera_status("bottom")
                     # Use single letters: A=Available, I=In Use, E=Error
-                    top_short = "A" if top_status.value == "available" else ("I" if top_status.value == "in_use" else "E")
-                    bottom_short = "A" if bottom_status.value == "available" else ("I" if bottom_status.value == "in_use" else "E")
+                    top_short = CAMERA_STATUS_SHORT.get(top_status.value, "E")
+                    bottom_short = CAMERA_STATUS_SHORT.get(bottom_status.value, "E")
                     enhanced_status += f" | C:{top_short}{bottom_short}"
                 except:
                     pass
@@ -2752,39 +3626,51 @@ class WoodSortingApp(QMainWindow):
             if len(enhanced_status) > 80:
                 enhanced_status = enhanced_status[:77] + "..."
 
-            self.system_status_label.setText(enhanced_status)
-            self.system_status_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #2c3e50;")
+            # Unchanged text and style are skipped so Qt doesn't relayout or re-polish
+            self._set_text(self.system_status_label, enhanced_status)
+            self._set_style(self.system_status_label, SYSTEM_STATUS_STYLE)
         except Exception as e:
             # Fallback to basic status if enhancement fails
             # Truncate if too long
             if len(status_text) > 80:
                 status_text = status_text[:77] + "..."
-            self.system_status_label.setText(status_text)
-            self.system_status_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #2c3e50;")
+            self._set_text(self.system_status_label, status_text)
+            self._set_style(self.system_status_label, SYSTEM_STATUS_STYLE)
+
+    def _count_graded_piece(self, grade):
+        """Record a graded piece in the session statistics and mark the counters for refresh"""
+        self.grade_counts[grade] += 1
+        self.live_stats[self._live_stats_keys[grade]] += 1
+        self.total_pieces_processed += 1
+        self._live_stats_dirty = True
 
     def update_grade_counters(self):
         """Update grade counters in the UI"""
         try:
-            # Update individual grade counts
-            for grade in range(4):
-                count_label = getattr(self, f"grade_{grade}_count", None)
-                if count_label:
-                    count = self.live_stats.get(f"grade{grade}", 0)
-                    count_label.setText(str(count))
-
-            # Update total processed
-            if hasattr(self, 'total_processed_label'):
-                self.total_processed_label.setText(str(self.total_pieces_processed))
-
-            # Update percentages
-            total = sum(self.live_stats.values())
-            if total > 0:
-                for grade in range(4):
-                    percentage_label = getattr(self, f"grade_{grade}_percentage", None)
-                    if percentage_label:
-                        count = self.live_stats.get(f"grade{grade}", 0)
+            if not self._live_stats_dirty:
+                return
+
+            # Repaint the stats tabs once for the whole batch of label changes
+            self.stats_notebook.setUpdatesEnabled(False)
+            try:
+                # Update individual grade counts
+                counts = [self.live_stats.get(self._live_stats_keys[grade], 0) for grade in range(4)]
+                for count_label, count in zip(self._grade_count_labels, counts):
+                    self._set_text(count_label, str(count))
+
+                # Update total processed
+                self._set_text(self.total_processed_label, str(self.total_pieces_processed))
+
+                # Update percentages
+                total = sum(self.live_stats.values())
+                if total > 0:
+                    for percentage_label, count in zip(self._grade_percentage_labels, counts):
                         percentage = (count / total) * 100
-                        percentage_label.setText(f"{percentage:.1f}%")
+                        self._set_text(percentage_label, f"{percentage:.1f}%")
+            finally:
+                self.stats_notebook.setUpdatesEnabled(True)
+
+            self._live_stats_dirty = False
 
         except Exception as e:
             log_error(SystemComponent.GUI, f"Error updating grade counters: {str(e)}", e)
@@ -2796,7 +3682,7 @@ class WoodSortingApp(QMainWindow):
                 'timestamp': QDateTime.currentDateTime().toString(),
                 'total_processed': self.total_pieces_processed,
                 'grade_counts': self.grade_counts,
-                'session_duration': self.session_duration_label.text() if hasattr(self, 'session_duration_label') else "00:00:00",
+                'session_duration': self.session_duration_label.text(),
                 'wood_classification': self.wood_classification,
                 'detection_state': self.detection_state,
                 'current_mode': self.current_mode,
@@ -2814,74 +3700,82 @@ class WoodSortingApp(QMainWindow):
         """Export system log to file"""
         try:
             if hasattr(self, 'log_display'):
+                # Widget text must be read on the GUI thread; the disk write happens off it
+                self._flush_log_buffer()
                 log_content = self.log_display.toPlainText()
                 timestamp = QDateTime.currentDateTime().toString('yyyy-MM-dd_hh-mm-ss')
                 filename = f"logs/system_log_{timestamp}.txt"
 
-                with open(filename, 'w') as f:
-                    f.write(log_content)
-
-                self.display_message(f"Log exported to: {filename}")
+                threading.Thread(target=self._write_exported_log, args=(filename, log_content), daemon=True).start()
 
         except Exception as e:
             self.display_message(f"Error exporting log: {str(e)}", "error")
 
+    def _write_exported_log(self, filename, log_content):
+        """Write an exported log to disk (export thread); the outcome is reported on the GUI thread"""
+        try:
+            with open(filename, 'w', buffering=1 << 20) as f:
+                f.write(log_content)
+            self.log_export_finished.emit(f"Log exported to: {filename}", "info")
+        except Exception as e:
+            self.log_export_finished.emit(f"Error exporting log: {str(e)}", "error")
+
     def update_model_health_display(self):
         """Update model health status display"""
         try:
-            if hasattr(self.detection_module, 'get_model_health_status'):
-                health_status = self.detection_module.get_model_health_status()
-                self.model_health_label.setText(f"Model Health: {health_status.value.upper()}")
-
-                # Set color based on health status
-                if health_status.value == "healthy":
-                    color = "#27ae60"  # Green
-                elif health_status.value == "degraded":
-                    color = "#f39c12"  # Orange
-                elif health_status.value == "unhealthy":
-                    color = "#e74c3c"  # Red
-                else:
-                    color = "#95a5a6"  # Gray
+            health_status = self._get_model_health() if self._get_model_health else None
+            get_report = getattr(self.detection_module, 'get_model_performance_report', None)
+            performance_report = get_report() if get_report else None
+
+            # Nothing to redraw if the displayed fields are what was shown last time
+            health_key = (health_status,) + (
+                tuple(performance_report.get(key, 0) for key in ('avg_inference_time', 'success_rate', 'total_inferences'))
+                if performance_report else ()
+            )
+            if health_key == self._last_health_key:
+                return
+            self._last_health_key = health_key
 
-                self.model_health_label.setStyleSheet(f"font-size: 16px; font-weight: bold; padding: 10px; color: {color};")
+            if health_status is not None:
+                self._set_text(self.model_health_label, f"Model Health: {health_status.value.upper()}")
 
-            if hasattr(self.detection_module, 'get_model_performance_report'):
-                performance_report = self.detection_module.get_model_performance_report()
+                # Set color based on health status
+                self._set_style(self.model_health_label,
+                                MODEL_HEALTH_STYLES.get(health_status.value, MODEL_HEALTH_UNKNOWN_STYLE))
 
+            if get_report:
                 if performance_report:
                     # Update inference time
                     avg_time = performance_report.get('avg_inference_time', 0)
-                    self.avg_inference_time_label.setText(f"{avg_time:.2f} ms")
+                    self._set_text(self.avg_inference_time_label, f"{avg_time:.2f} ms")
 
                     # Set inference time status
                     if avg_time < 500:
-                        self.inference_time_status.setText("Good")
-                        self.inference_time_status.setStyleSheet("color: #27ae60;")
+                        status_text, status_style = "Good", STATUS_STYLE_GOOD
                     elif avg_time < 1000:
-                        self.inference_time_status.setText("Slow")
-                        self.inference_time_status.setStyleSheet("color: #f39c12;")
+                        status_text, status_style = "Slow", STATUS_STYLE_WARNING
                     else:
-                        self.inference_time_status.setText("Critical")
-                        self.inference_time_status.setStyleSheet("color: #e74c3c;")
+                        status_text, status_style = "Critical", STATUS_STYLE_BAD
+                    self._set_text(self.inference_time_status, status_text)
+                    self._set_style(self.inference_time_status, status_style)
 
                     # Update success rate
                     success_rate = performance_report.get('success_rate', 0) * 100
-                    self.success_rate_label.setText(f"{success_rate:.1f}%")
+                    self._set_text(self.success_rate_label, f"{success_rate:.1f}%")
 
                     # Set success rate status
                     if success_rate > 95:
-                        self.success_rate_status.setText("Excellent")
-                        self.success_rate_status.setStyleSheet("color: #27ae60;")
+                        status_text, status_style = "Excellent", STATUS_STYLE_GOOD
                     elif success_rate > 85:
-                        self.success_rate_status.setText("Good")
-                        self.success_rate_status.setStyleSheet("color: #f39c12;")
+                        status_text, status_style = "Good", STATUS_STYLE_WARNING
                     else:
-                        self.success_rate_status.setText("Poor")
-                        self.success_rate_status.setStyleSheet("color: #e74c3c;")
+                        status_text, status_style = "Poor", STATUS_STYLE_BAD
+                    self._set_text(self.success_rate_status, status_text)
+                    self._set_style(self.success_rate_status, status_style)
 
                     # Update total inferences
                     total_inferences = performance_report.get('total_inferences', 0)
-                    self.total_inferences_label.setText(str(total_inferences))
+                    self._set_text(self.total_inferences_label, str(total_inferences))
 
         except Exception as e:
             self.display_message(f"Error updating model health display: {str(e)}", "warning")
@@ -2889,41 +3783,15 @@ class WoodSortingApp(QMainWindow):
     def update_camera_status_display(self):
         """Update camera status display"""
         try:
-            # Update top camera status
-            if hasattr(self.detection_module, 'get_camera_status'):
-                top_status = self.detection_module.get_camera_status("top")
-                self.top_camera_health_status.setText(top_status.value.upper())
-
-                # Set color based on status
-                if top_status.value == "available":
-                    color = "#27ae60"  # Green
-                elif top_status.value == "in_use":
-                    color = "#f39c12"  # Orange
-                else:
-                    color = "#e74c3c"  # Red
-
-                self.top_camera_health_status.setStyleSheet(f"color: {color};")
-
-            # Update bottom camera status
-            if hasattr(self.detection_module, 'get_camera_status'):
-                bottom_status = self.detection_module.get_camera_status("bottom")
-                self.bottom_camera_health_status.setText(bottom_status.value.upper())
-
-                # Set color based on status
-                if bottom_status.value == "available":
-                    color = "#27ae60"  # Green
-                elif bottom_status.value == "in_use":
-                    color = "#f39c12"  # Orange
-                else:
-                    color = "#e74c3c"  # Red
-
-                self.bottom_camera_health_status.setStyleSheet(f"color: {color};")
+            # Usage statistics are not tracked yet; their labels are created showing "N/A"
+            if self._get_camera_status is not None:
+                for camera_name, status_label in (("top", self.top_camera_health_status),
+                                                  ("bottom", self.bottom_camera_health_status)):
+                    camera_status = self._get_camera_status(camera_name)
+                    self._set_text(status_label, camera_status.value.upper())
 
-            # Update usage statistics (mock data for now)
-            self.top_camera_usage_count.setText("N/A")
-            self.bottom_camera_usage_count.setText("N/A")
-            self.top_camera_last_used.setText("N/A")
-            self.bottom_camera_last_used.setText("N/A")
+                    # Set color based on status
+                    self._set_style(status_label, CAMERA_HEALTH_STYLES.get(camera_status.value, STATUS_STYLE_BAD))
 
         except Exception as e:
             self.display_message(f"Error updating camera status display: {str(e)}", "warning")
@@ -3067,10 +3935,9 @@ class WoodSortingApp(QMainWindow):
             self.error_status_text.setPlainText("✅ Error state reset\n\nNo errors detected")
 
             # Reset model health monitoring if available
-            if hasattr(self.detection_module, 'model_manager') and hasattr(self.detection_module.model_manager, 'health_monitor'):
+            if self._model_health_metrics is not None:
                 # Clear the metrics (this is a simplified reset)
-                if hasattr(self.detection_module.model_manager.health_monitor, 'metrics'):
-                    self.detection_module.model_manager.health_monitor.metrics.clear()
+                self._model_health_metrics.clear()
 
             self.display_message("Error state reset successfully", "info")
             self.update_model_health_display()
@@ -3083,50 +3950,68 @@ class WoodSortingApp(QMainWindow):
         """Update the ROI list for the selected camera"""
         try:
             camera_name = self.roi_camera_combo.currentText()
-            self.roi_list_widget.clear()
 
-            if hasattr(self, 'roi_module') and self.roi_module:
-                active_rois = self.roi_module.roi_manager.get_active_rois(camera_name)
-                roi_states = self.roi_module.roi_manager.roi_states.get(camera_name, {})
-
-                for roi_id in active_rois:
-                    roi_config = self.roi_module.roi_manager.get_roi_config(camera_name, roi_id)
-                    if roi_config:
-                        status = roi_states.get(roi_id, ROIStatus.INACTIVE)
-                        item_text = f"{roi_config.name} ({roi_id}) - {status.value}"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, roi_id)
-                        self.roi_list_widget.addItem(item)
+            # The model only touches rows that differ from what the view already shows
+            self.roi_list_model.set_rows([
+                (roi_id, f"{roi_config.name} ({roi_id}) - {ROI_STATUS_TEXT[status]}")
+                for roi_id, (roi_config, status) in self._roi_manager.get_roi_snapshot(camera_name).items()
+            ])
 
         except Exception as e:
             self.display_message(f"Error updating ROI list: {str(e)}", "warning")
 
+    def _selected_roi_id(self):
+        """Return the ROI ID of the current row in the ROI list, or None"""
+        index = self.roi_list_view.currentIndex()
+        return index.data(Qt.UserRole) if index.isValid() else None
+
     def on_roi_selected(self):
         """Handle ROI selection in the list"""
         try:
-            current_item = self.roi_list_widget.currentItem()
-            if not current_item:
+            roi_id = self._selected_roi_id()
+            if roi_id is None:
                 return
 
             camera_name = self.roi_camera_combo.currentText()
-            roi_id = current_item.data(Qt.UserRole)
 
             roi_config = self.get_roi_config(camera_name, roi_id)
             if roi_config:
-                    # Update property fields
+                # Update property fields with their change signals held back;
+                # the single preview below covers the whole selection
+                fields = (self.roi_name_edit, self.roi_x1_spin, self.roi_y1_spin,
+                          self.roi_x2_spin, self.roi_y2_spin, self.roi_threshold_spin)
+                for field in fields:
+                    field.blockSignals(True)
+                try:
                     self.roi_name_edit.setText(roi_config.name)
-                    self.roi_x1_spin.setValue(roi_config.coordinates[0])
-                    self.roi_y1_spin.setValue(roi_config.coordinates[1])
-                    self.roi_x2_spin.setValue(roi_config.coordinates[2])
-                    self.roi_y2_spin.setValue(roi_config.coordinates[3])
+                    x1, y1, x2, y2 = roi_config.coordinates
+                    self.roi_x1_spin.setValue(x1)
+                    self.roi_y1_spin.setValue(y1)
+                    self.roi_x2_spin.setValue(x2)
+                    self.roi_y2_spin.setValue(y2)
                     self.roi_threshold_spin.setValue(roi_config.overlap_threshold)
+                finally:
+                    for field in fields:
+                        field.blockSignals(False)
 
-                    # Update preview
-                    self.update_roi_preview(camera_name, roi_config)
+                # Update preview
+                self._schedule_roi_preview(camera_name, roi_config)
 
         except Exception as e:
             self.display_message(f"Error selecting ROI: {str(e)}", "warning")
 
+    def _schedule_roi_preview(self, camera_name, roi_config):
+        """Queue an ROI preview redraw; only the latest request within the debounce window is drawn"""
+        self._pending_roi_preview = (camera_name, roi_config)
+        self._roi_preview_timer.start()
+
+    def _apply_pending_roi_preview(self):
+        """Draw the most recently scheduled ROI preview"""
+        pending = self._pending_roi_preview
+        self._pending_roi_preview = None
+        if pending is not None:
+            self.update_roi_preview(*pending)
+
     def update_roi_preview(self, camera_name, roi_config):
         """Update the ROI preview image"""
         try:
@@ -3137,27 +4022,59 @@ class WoodSortingApp(QMainWindow):
                 frame = self.bottom_frame_original
 
             if frame is not None:
-                # Create a copy for drawing
-                preview_frame = frame.copy()
-
-                # Draw ROI rectangle
-                x1, y1, x2, y2 = roi_config.coordinates
-                cv2.rectangle(preview_frame, (x1, y1), (x2, y2), (255, 0, 0), 2)
-
-                # Add ROI info text
-                cv2.putText(preview_frame, f"ROI: {roi_config.name}", (x1 + 10, y1 + 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 0, 0), 2)
-
-                # Convert to QPixmap and display
-                rgb_image = cv2.cvtColor(preview_frame, cv2.COLOR_BGR2RGB)
-                h, w = rgb_image.shape[:2]
-                bytes_per_line = 3 * w
-                qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-
-                pixmap = QPixmap.fromImage(qt_image)
-                scaled_pixmap = pixmap.scaled(self.roi_preview_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.roi_preview_label.setPixmap(scaled_pixmap)
+                # Redrawing the same ROI over the same frame at the same size changes nothing
+                label_size = self.roi_preview_label.size()
+                preview_key = (camera_name, roi_config.name, tuple(roi_config.coordinates),
+                               label_size.width(), label_size.height())
+                last = self._roi_preview_last
+                if last is not None and last[0] is frame and last[1] == preview_key:
+                    return
+
+                # Convert and scale each source frame once per label size; ROI edits
+                # only repaint the outline on a copy of the scaled pixmap
+                cached = self._roi_preview_base.get(camera_name)
+                if cached is None or cached[0] is not frame or cached[1] != label_size:
+                    if QIMAGE_FORMAT_BGR888 is not None:
+                        # Qt reads OpenCV's BGR buffer directly; no conversion pass
+                        image = np.ascontiguousarray(frame)
+                        image_format = QIMAGE_FORMAT_BGR888
+                    else:
+                        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        image_format = QImage.Format_RGB888
+                    h, w = image.shape[:2]
+                    bytes_per_line = 3 * w
+                    # qt_image borrows image's buffer; it is only read before image goes out of scope
+                    qt_image = QImage(image.data, w, h, bytes_per_line, image_format)
+
+                    # Reuse one full-size pixmap per camera rather than allocating one per frame
+                    pixmap = self._roi_preview_source.get(camera_name)
+                    if pixmap is None:
+                        pixmap = self._roi_preview_source[camera_name] = QPixmap()
+                    pixmap.convertFromImage(qt_image)
+                    base_pixmap = pixmap.scaled(label_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    cached = (frame, label_size, base_pixmap, base_pixmap.width() / w)
+                    self._roi_preview_base[camera_name] = cached
+                _, _, base_pixmap, scale = cached
+
+                preview_pixmap = QPixmap(base_pixmap)
+                painter = QPainter(preview_pixmap)
+                try:
+                    painter.setPen(QPen(ROI_PREVIEW_COLOR, 2))
+                    painter.setFont(self._roi_preview_font)
+
+                    # Draw ROI rectangle in preview coordinates
+                    x1, y1, x2, y2 = (round(v * scale) for v in roi_config.coordinates)
+                    painter.drawRect(x1, y1, x2 - x1, y2 - y1)
+
+                    # Add ROI info text
+                    painter.drawText(x1 + 5, y1 + 15, f"ROI: {roi_config.name}")
+                finally:
+                    painter.end()
+
+                self.roi_preview_label.setPixmap(preview_pixmap)
+                self._roi_preview_last = (frame, preview_key)
             else:
+                self._roi_preview_last = None
                 self.roi_preview_label.setText("No frame available for preview")
 
         except Exception as e:
@@ -3170,7 +4087,7 @@ class WoodSortingApp(QMainWindow):
             roi_name = self.roi_name_edit.text().strip()
 
             if not roi_name:
-                roi_name = f"ROI_{len(self.roi_module.roi_manager.get_active_rois(camera_name)) + 1}"
+                roi_name = f"ROI_{self._roi_manager.get_active_roi_count(camera_name) + 1}"
 
             # Get coordinates from spin boxes
             x1 = self.roi_x1_spin.value()
@@ -3178,41 +4095,57 @@ class WoodSortingApp(QMainWindow):
             x2 = self.roi_x2_spin.value()
             y2 = self.roi_y2_spin.value()
 
-            # Validate coordinates
-            if x2 <= x1 or y2 <= y1:
-                self.display_message("Invalid ROI coordinates: X2 must be > X1 and Y2 must be > Y1", "error")
+            # Accept corners in either order; only a zero-width or zero-height ROI is invalid
+            x1, x2 = min(x1, x2), max(x1, x2)
+            y1, y2 = min(y1, y2), max(y1, y2)
+            if x1 == x2 or y1 == y2:
+                self.display_message("Invalid ROI coordinates: width and height must be non-zero", "error")
                 return
 
             coordinates = (x1, y1, x2, y2)
             threshold = self.roi_threshold_spin.value()
 
-            # Generate unique ROI ID
-            roi_id = f"{camera_name}_roi_{int(time.time())}"
+            # Generate unique ROI ID; skip suffixes already taken by ROIs loaded from config
+            existing_ids = self._roi_manager.rois.get(camera_name, {})
+            roi_id = f"{camera_name}_roi_{next(self._roi_id_counter)}"
+            while roi_id in existing_ids:
+                roi_id = f"{camera_name}_roi_{next(self._roi_id_counter)}"
 
-            if hasattr(self, 'roi_module') and self.roi_module:
-                success = self.roi_module.roi_manager.define_roi(
-                    camera_name, roi_id, coordinates, roi_name, threshold
-                )
+            success = self._roi_manager.define_roi(
+                camera_name, roi_id, coordinates, roi_name, threshold
+            )
 
-                if success:
-                    self.display_message(f"ROI '{roi_name}' added successfully", "info")
-                    self.update_roi_list()
-                else:
-                    self.display_message("Failed to add ROI", "error")
+            if success:
+                self.display_message(f"ROI '{roi_name}' added successfully", "info")
+                self.update_roi_list()
+            else:
+                self.display_message("Failed to add ROI", "error")
 
         except Exception as e:
             self.display_message(f"Error adding ROI: {str(e)}", "error")
 
+    def _schedule_roi_save(self):
+        """Mark the ROI config changed and write it once the current burst of edits ends"""
+        self._roi_manager.mark_changed()
+        self._roi_dirty = True
+        self._roi_save_timer.start()
+
+    def _flush_roi_config(self):
+        """Write pending ROI edits to disk"""
+        self._roi_save_timer.stop()
+        if self._roi_dirty:
+            self._roi_dirty = False
+            self._roi_manager.save_config()
+
     def edit_roi(self):
         """Edit the selected ROI"""
         try:
-            current_item = self.roi_list_widget.currentItem()
-            if not current_item:
+            roi_id = self._selected_roi_id()
+            if roi_id is None:
                 self.display_message("Please select an ROI to edit", "warning")
                 return
 
             camera_name = self.roi_camera_combo.currentText()
-            roi_id = current_item.data(Qt.UserRole)
 
             # Get updated values
             roi_name = self.roi_name_edit.text().strip()
@@ -3222,8 +4155,10 @@ class WoodSortingApp(QMainWindow):
             y2 = self.roi_y2_spin.value()
             threshold = self.roi_threshold_spin.value()
 
-            # Validate coordinates
-            if x2 <= x1 or y2 <= y1:
+            # Accept corners in either order; only a zero-width or zero-height ROI is invalid
+            x1, x2 = min(x1, x2), max(x1, x2)
+            y1, y2 = min(y1, y2), max(y1, y2)
+            if x1 == x2 or y1 == y2:
                 self.display_message("Invalid ROI coordinates", "error")
                 return
 
@@ -3235,7 +4170,7 @@ class WoodSortingApp(QMainWindow):
                 roi_config.overlap_threshold = threshold
 
                 # Save configuration
-                self.roi_module.roi_manager.save_config()
+                self._schedule_roi_save()
                 self.display_message(f"ROI '{roi_name}' updated successfully", "info")
                 self.update_roi_list()
             else:
@@ -3247,36 +4182,28 @@ class WoodSortingApp(QMainWindow):
     def delete_roi(self):
         """Delete the selected ROI"""
         try:
-            current_item = self.roi_list_widget.currentItem()
-            if not current_item:
+            roi_id = self._selected_roi_id()
+            if roi_id is None:
                 self.display_message("Please select an ROI to delete", "warning")
                 return
 
             camera_name = self.roi_camera_combo.currentText()
-            roi_id = current_item.data(Qt.UserRole)
 
-            if hasattr(self, 'roi_module') and self.roi_module:
-                # Remove from active ROIs
-                if camera_name in self.roi_module.roi_manager.active_rois:
-                    self.roi_module.roi_manager.active_rois[camera_name].discard(roi_id)
+            # Remove the ROI from the manager in one locked step; the write is batched
+            if not self._roi_manager.delete_roi(camera_name, roi_id, save=False):
+                self.display_message("Failed to delete ROI", "error")
+                return
 
-                # Remove from ROIs dict
-                if camera_name in self.roi_module.roi_manager.rois:
-                    self.roi_module.roi_manager.rois[camera_name].pop(roi_id, None)
+            # Save configuration
+            self._schedule_roi_save()
 
-                # Remove from states
-                if camera_name in self.roi_module.roi_manager.roi_states:
-                    self.roi_module.roi_manager.roi_states[camera_name].pop(roi_id, None)
+            self.display_message("ROI deleted successfully", "info")
+            self.update_roi_list()
 
-                # Save configuration
-                self.roi_module.roi_manager.save_config()
-
-                self.display_message("ROI deleted successfully", "info")
-                self.update_roi_list()
-
-                # Clear property fields
-                self.roi_name_edit.clear()
-                self.roi_preview_label.setText("Select an ROI to preview")
+            # Clear property fields
+            self.roi_name_edit.clear()
+            self._roi_preview_last = None
+            self.roi_preview_label.setText("Select an ROI to preview")
 
         except Exception as e:
             self.display_message(f"Error deleting ROI: {str(e)}", "error")
@@ -3284,21 +4211,19 @@ class WoodSortingApp(QMainWindow):
     def activate_roi(self):
         """Activate the selected ROI"""
         try:
-            current_item = self.roi_list_widget.currentItem()
-            if not current_item:
+            roi_id = self._selected_roi_id()
+            if roi_id is None:
                 self.display_message("Please select an ROI to activate", "warning")
                 return
 
             camera_name = self.roi_camera_combo.currentText()
-            roi_id = current_item.data(Qt.UserRole)
 
-            if hasattr(self, 'roi_module') and self.roi_module:
-                success = self.roi_module.roi_manager.activate_roi(camera_name, roi_id)
-                if success:
-                    self.display_message("ROI activated successfully", "info")
-                    self.update_roi_list()
-                else:
-                    self.display_message("Failed to activate ROI", "error")
+            success = self._roi_manager.activate_roi(camera_name, roi_id)
+            if success:
+                self.display_message("ROI activated successfully", "info")
+                self.update_roi_list()
+            else:
+                self.display_message("Failed to activate ROI", "error")
 
         except Exception as e:
             self.display_message(f"Error activating ROI: {str(e)}", "error")
@@ -3306,21 +4231,19 @@ class WoodSortingApp(QMainWindow):
     def deactivate_roi(self):
         """Deactivate the selected ROI"""
         try:
-            current_item = self.roi_list_widget.currentItem()
-            if not current_item:
+            roi_id = self._selected_roi_id()
+            if roi_id is None:
                 self.display_message("Please select an ROI to deactivate", "warning")
                 return
 
             camera_name = self.roi_camera_combo.currentText()
-            roi_id = current_item.data(Qt.UserRole)
 
-            if hasattr(self, 'roi_module') and self.roi_module:
-                success = self.roi_module.roi_manager.deactivate_roi(camera_name, roi_id)
-                if success:
-                    self.display_message("ROI deactivated successfully", "info")
-                    self.update_roi_list()
-                else:
-                    self.display_message("Failed to deactivate ROI", "error")
+            success = self._roi_manager.deactivate_roi(camera_name, roi_id)
+            if success:
+                self.display_message("ROI deactivated successfully", "info")
+                self.update_roi_list()
+            else:
+                self.display_message("Failed to deactivate ROI", "error")
 
         except Exception as e:
             self.display_message(f"Error deactivating ROI: {str(e)}", "error")
@@ -3328,43 +4251,47 @@ class WoodSortingApp(QMainWindow):
     def save_roi_config(self):
         """Save ROI configuration"""
         try:
-            if hasattr(self, 'roi_module') and self.roi_module:
-                success = self.roi_module.roi_manager.save_config()
-                if success:
-                    self.display_message("ROI configuration saved successfully", "info")
-                else:
-                    self.display_message("Failed to save ROI configuration", "error")
+            self._roi_save_timer.stop()
+            self._roi_dirty = False
+            success = self._roi_manager.save_config()
+            if success:
+                self.display_message("ROI configuration saved successfully", "info")
+            else:
+                self.display_message("Failed to save ROI configuration", "error")
         except Exception as e:
             self.display_message(f"Error saving ROI configuration: {str(e)}", "error")
 
     def load_roi_config(self):
         """Load ROI configuration"""
         try:
-            if hasattr(self, 'roi_module') and self.roi_module:
-                success = self.roi_module.roi_manager.load_config()
-                if success:
-                    self.display_message("ROI configuration loaded successfully", "info")
-                    self.update_roi_list()
-                else:
-                    self.display_message("Failed to load ROI configuration", "error")
+            # Loading replaces the in-memory ROIs, so unsaved edits are dropped
+            self._roi_save_timer.stop()
+            self._roi_dirty = False
+            success = self._roi_manager.load_config()
+            if success:
+                self.display_message("ROI configuration loaded successfully", "info")
+                self.update_roi_list()
+            else:
+                self.display_message("Failed to load ROI configuration", "error")
         except Exception as e:
             self.display_message(f"Error loading ROI configuration: {str(e)}", "error")
 
     def reset_roi_config(self):
         """Reset ROI configuration to default"""
         try:
-            if hasattr(self, 'roi_module') and self.roi_module:
-                # Clear all ROIs
-                self.roi_module.roi_manager.rois.clear()
-                self.roi_module.roi_manager.active_rois.clear()
-                self.roi_module.roi_manager.roi_states.clear()
+            roi_manager = self._roi_manager
+            # Clear all ROIs
+            roi_manager.rois.clear()
+            roi_manager.active_rois.clear()
+            roi_manager.roi_states.clear()
 
-                # Create default ROIs
-                self.roi_module.roi_manager.define_roi("top", "top_roi_1", (64, 0, 1216, 108), "Top ROI", 0.3)
-                self.roi_module.roi_manager.define_roi("bottom", "bottom_roi_1", (64, 612, 1216, 720), "Bottom ROI", 0.3)
+            # Create default ROIs
+            for camera_name, roi_id, coordinates, name, threshold in self.DEFAULT_ROIS:
+                roi_manager.define_roi(camera_name, roi_id, coordinates, name, threshold, save=False)
+            self._schedule_roi_save()
 
-                self.display_message("ROI configuration reset to default", "info")
-                self.update_roi_list()
+            self.display_message("ROI configuration reset to default", "info")
+            self.update_roi_list()
 
         except Exception as e:
             self.display_message(f"Error resetting ROI configuration: {str(e)}", "error")
@@ -3372,9 +4299,9 @@ class WoodSortingApp(QMainWindow):
     def get_roi_config(self, camera_name, roi_id):
         """Get ROI configuration from the ROI manager"""
         try:
-            if hasattr(self, 'roi_module') and self.roi_module:
-                if camera_name in self.roi_module.roi_manager.rois:
-                    return self.roi_module.roi_manager.rois[camera_name].get(roi_id)
+            roi_manager = self._roi_manager
+            if camera_name in roi_manager.rois:
+                return roi_manager.rois[camera_name].get(roi_id)
             return None
         except Exception as e:
             self.display_message(f"Error getting ROI config: {str(e)}", "warning")
@@ -186,6 +186,11 @@ class PerformanceMonitor:
             elapsed_time = (time.time() - start_time) * 1000  # Convert to ms
             self.component_times[component].append(elapsed_time)
             
+    def record_component_time(self, component: str, elapsed_ms: float):
+        """Record an already measured duration (ms) for a specific component"""
+        if component in self.component_times:
+            self.component_times[component].append(elapsed_ms)
+
     def get_performance_summary(self) -> Dict[str, float]:
         """Get current performance summary"""
         return {
@@ -179,11 +179,10 @@ class ROIAnnotationTool:
         """Add help overlay"""
         height, width = self.display_image.shape[:2]
 
-        # Semi-transparent background
-        overlay = self.display_image.copy()
-        cv2.rectangle(overlay, (width-350, height-250), (width-10, height-10),
-                     (0, 0, 0), -1)
-        cv2.addWeighted(self.display_image, 0.7, overlay, 0.3, 0, self.display_image)
+        # Semi-transparent background: blending 30% black only darkens the panel area,
+        # so scale that region in place instead of copying and blending the whole image
+        panel = self.display_image[max(height-250, 0):max(height-9, 0), max(width-350, 0):max(width-9, 0)]
+        cv2.addWeighted(panel, 0.7, panel, 0.0, 0, dst=panel)
 
         # Help text
         help_lines = [
@@ -38,9 +38,36 @@ from modules.wood_detection_module import (
 from modules.error_handler import log_info, log_warning, log_error, SystemComponent
 from modules.utils_module import calculate_defect_size
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+def _bbox_iou_impl(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2):
+    """IoU of boxes (ax1, ay1, ax2, ay2) and (bx1, by1, bx2, by2); 0.0 when they don't overlap"""
+    inter_x_min = max(ax1, bx1)
+    inter_y_min = max(ay1, by1)
+    inter_x_max = min(ax2, bx2)
+    inter_y_max = min(ay2, by2)
+
+    # Check if there's intersection
+    if inter_x_max <= inter_x_min or inter_y_max <= inter_y_min:
+        return 0.0
+
+    # Calculate areas
+    inter_area = (inter_x_max - inter_x_min) * (inter_y_max - inter_y_min)
+    union_area = (ax2 - ax1) * (ay2 - ay1) + (bx2 - bx1) * (by2 - by1) - inter_area
+    if union_area == 0:
+        return 0.0
+    return inter_area / union_area
+
+# Runs for every wood box against every active ROI on every frame
+bbox_iou = njit(cache=True)(_bbox_iou_impl) if NUMBA_AVAILABLE else _bbox_iou_impl
+
 class ROIStatus(Enum):
     """ROI status enumeration"""
     ACTIVE = "active"
@@ -200,6 +227,8 @@ class ROIManager:
         self.active_rois: Dict[str, set] = {}  # {camera_name: set of active roi_ids}
         self.roi_states: Dict[str, Dict[str, ROIStatus]] = {}  # {camera_name: {roi_id: status}}
         self.lock = threading.RLock()
+        # Bumped whenever the ROI configuration changes so readers can cache derived data
+        self.version = 0
 
         # Load configuration
         self.load_config()
@@ -207,8 +236,8 @@ class ROIManager:
         log_info(SystemComponent.CAMERA, f"ROIManager initialized with {len(self.rois)} cameras")
 
     def define_roi(self, camera_name: str, roi_id: str, coordinates: Tuple[int, int, int, int],
-                   name: str = "", overlap_threshold: float = 0.3) -> bool:
-        """Define a new ROI for a camera feed"""
+                   name: str = "", overlap_threshold: float = 0.3, save: bool = True) -> bool:
+        """Define a new ROI for a camera feed; with save=False the caller persists it later"""
         try:
             with self.lock:
                 if camera_name not in self.rois:
@@ -236,7 +265,10 @@ class ROIManager:
                 self.roi_states[camera_name][roi_id] = ROIStatus.ACTIVE
 
                 # Save configuration
-                self.save_config()
+                if save:
+                    self.save_config()
+                else:
+                    self.mark_changed()
 
                 log_info(SystemComponent.CAMERA,
                         f"Defined ROI {roi_id} for camera {camera_name}: {coordinates}")
@@ -283,11 +315,28 @@ class ROIManager:
         with self.lock:
             return list(self.active_rois.get(camera_name, set()))
 
+    def get_active_roi_count(self, camera_name: str) -> int:
+        """Get the number of active ROIs for a camera without copying their IDs"""
+        with self.lock:
+            return len(self.active_rois.get(camera_name, ()))
+
     def get_roi_config(self, camera_name: str, roi_id: str) -> Optional[ROIConfig]:
         """Get ROI configuration"""
         with self.lock:
             return self.rois.get(camera_name, {}).get(roi_id)
 
+    def get_roi_snapshot(self, camera_name: str) -> Dict[str, Tuple[ROIConfig, ROIStatus]]:
+        """Get {roi_id: (config, status)} for a camera's active ROIs, read under a single lock"""
+        with self.lock:
+            configs = self.rois.get(camera_name, {})
+            states = self.roi_states.get(camera_name, {})
+            snapshot = {}
+            for roi_id in self.active_rois.get(camera_name, ()):
+                roi_config = configs.get(roi_id)
+                if roi_config:
+                    snapshot[roi_id] = (roi_config, states.get(roi_id, ROIStatus.INACTIVE))
+            return snapshot
+
     def update_roi_coordinates(self, camera_name: str, roi_id: str,
                               coordinates: Tuple[int, int, int, int]) -> bool:
         """Update ROI coordinates"""
@@ -307,16 +356,18 @@ class ROIManager:
             log_error(SystemComponent.CAMERA, f"Error updating ROI coordinates: {e}")
             return False
 
-    def delete_roi(self, camera_name: str, roi_id: str) -> bool:
-        """Delete an ROI"""
+    def delete_roi(self, camera_name: str, roi_id: str, save: bool = True) -> bool:
+        """Delete an ROI; with save=False the caller persists it later"""
         try:
             with self.lock:
                 if camera_name in self.rois and roi_id in self.rois[camera_name]:
                     del self.rois[camera_name][roi_id]
                     self.active_rois[camera_name].discard(roi_id)
-                    if roi_id in self.roi_states[camera_name]:
-                        del self.roi_states[camera_name][roi_id]
-                    self.save_config()
+                    self.roi_states[camera_name].pop(roi_id, None)
+                    if save:
+                        self.save_config()
+                    else:
+                        self.mark_changed()
                     log_info(SystemComponent.CAMERA, f"Deleted ROI {roi_id} for camera {camera_name}")
                     return True
                 return False
@@ -324,8 +375,13 @@ class ROIManager:
             log_error(SystemComponent.CAMERA, f"Error deleting ROI {roi_id}: {e}")
             return False
 
+    def mark_changed(self):
+        """Record an in-memory configuration change whose save is deferred"""
+        self.version += 1
+
     def load_config(self):
         """Load ROI configuration from JSON file"""
+        self.version += 1
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
@@ -356,6 +412,8 @@ class ROIManager:
 
     def save_config(self):
         """Save ROI configuration to JSON file"""
+        # Every configuration change is persisted through here
+        self.version += 1
         try:
             # Convert to serializable format
             data = {'rois': {}}
@@ -489,28 +547,8 @@ class OverlapDetector:
         try:
             x1_min, y1_min, x1_max, y1_max = bbox1
             x2_min, y2_min, x2_max, y2_max = bbox2
-
-            # Calculate intersection
-            inter_x_min = max(x1_min, x2_min)
-            inter_y_min = max(y1_min, y2_min)
-            inter_x_max = min(x1_max, x2_max)
-            inter_y_max = min(y1_max, y2_max)
-
-            # Check if there's intersection
-            if inter_x_max <= inter_x_min or inter_y_max <= inter_y_min:
-                return 0.0
-
-            # Calculate areas
-            inter_area = (inter_x_max - inter_x_min) * (inter_y_max - inter_y_min)
-            bbox1_area = (x1_max - x1_min) * (y1_max - y1_min)
-            bbox2_area = (x2_max - x2_min) * (y2_max - y2_min)
-
-            # Calculate IoU
-            union_area = bbox1_area + bbox2_area - inter_area
-            if union_area == 0:
-                return 0.0
-
-            return inter_area / union_area
+            return bbox_iou(float(x1_min), float(y1_min), float(x1_max), float(y1_max),
+                            float(x2_min), float(y2_min), float(x2_max), float(y2_max))
 
         except Exception as e:
             log_error(SystemComponent.CAMERA, f"Error calculating overlap: {e}")
@@ -1013,6 +1051,18 @@ class ROIVisualizer:
 
     Provides real-time overlay of ROIs and wood detections on camera feeds.
     """
+    # Wood box outline as a closed polyline over (x1, y1, x2, y2), in cv2.rectangle's point order
+    BOX_POINT_INDEX = np.array([[0, 1], [2, 1], [2, 3], [0, 3]])
+    # Wood corner markers as L-shaped 3-point polylines: corner picked from (x1, y1, x2, y2),
+    # then fixed offsets along one edge, the corner itself, and along the other edge
+    WOOD_MARKER_SIZE = 10
+    CORNER_POINT_INDEX = np.array([[0, 1], [2, 1], [0, 3], [2, 3]])
+    WOOD_MARKER_OFFSETS = WOOD_MARKER_SIZE * np.array([
+        [[0, 1], [0, 0], [1, 0]],
+        [[-1, 0], [0, 0], [0, 1]],
+        [[0, -1], [0, 0], [1, 0]],
+        [[-1, 0], [0, 0], [0, -1]],
+    ], dtype=np.int32)
 
     def __init__(self, roi_manager: ROIManager):
         self.roi_manager = roi_manager
@@ -1030,58 +1080,41 @@ class ROIVisualizer:
             'avg_render_time': 0.0
         }
 
-    def draw_roi_overlays(self, frame: np.ndarray, camera_name: str,
-                          overlapping_rois: Optional[List[str]] = None) -> np.ndarray:
-        """Draw ROI overlays on camera frame"""
-        start_time = time.time()
-        overlay_frame = frame.copy()
+        # {camera_name: (key, overlay, mask)} for the last ROI overlay rendered per camera
+        self._overlay_templates = {}
 
-        try:
+    def _get_overlay_template(self, frame_shape: Tuple, camera_name: str,
+                              overlapping_rois: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (overlay, mask) pair for a camera's ROIs, redrawn only when the ROIs or overlaps change"""
+        with self.roi_manager.lock:
             camera_rois = self.roi_manager.rois.get(camera_name, {})
-            overlapping_rois = overlapping_rois or []
+            overlapping = frozenset(roi_id for roi_id in overlapping_rois if roi_id in camera_rois)
+            key = (frame_shape, self.roi_manager.version, overlapping)
 
-            for roi_id, roi_data in camera_rois.items():
-                if not roi_data.active:
-                    continue
+            cached = self._overlay_templates.get(camera_name)
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2]
 
-                coordinates = roi_data.coordinates
-                x1, y1, x2, y2 = coordinates
+            overlay = np.zeros(frame_shape, dtype=np.uint8)
+            self._draw_roi_shapes(overlay, camera_rois, overlapping)
 
-                # Determine color based on overlap status
-                if roi_id in overlapping_rois:
-                    color = self.colors['overlap']
-                    status_text = "OVERLAP"
-                else:
-                    color = self.colors['active']
-                    status_text = "ACTIVE"
-
-                # Draw ROI rectangle
-                cv2.rectangle(overlay_frame, (x1, y1), (x2, y2), color, 3)
-
-                # Draw corner markers
-                marker_size = 15
-                # Top-left
-                cv2.line(overlay_frame, (x1, y1), (x1 + marker_size, y1), color, 2)
-                cv2.line(overlay_frame, (x1, y1), (x1, y1 + marker_size), color, 2)
-                # Top-right
-                cv2.line(overlay_frame, (x2, y1), (x2 - marker_size, y1), color, 2)
-                cv2.line(overlay_frame, (x2, y1), (x2, y1 + marker_size), color, 2)
-                # Bottom-left
-                cv2.line(overlay_frame, (x1, y2), (x1 + marker_size, y2), color, 2)
-                cv2.line(overlay_frame, (x1, y2), (x1, y2 - marker_size), color, 2)
-                # Bottom-right
-                cv2.line(overlay_frame, (x2, y2), (x2 - marker_size, y2), color, 2)
-                cv2.line(overlay_frame, (x2, y2), (x2, y2 - marker_size), color, 2)
-
-                # Add ROI label
-                label = f"{roi_data.name} ({roi_id}) - {status_text}"
-                cv2.putText(overlay_frame, label, (x1 + 10, y1 + 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+        mask = overlay.any(axis=2).astype(np.uint8) if overlay.ndim == 3 else (overlay > 0).astype(np.uint8)
+        self._overlay_templates[camera_name] = (key, overlay, mask)
+        return overlay, mask
+
+    def draw_roi_overlays(self, frame: np.ndarray, camera_name: str,
+                          overlapping_rois: Optional[List[str]] = None) -> np.ndarray:
+        """Draw ROI overlays on camera frame
+
+        The static ROI drawing is rendered once into a cached template and
+        copied onto each frame through its mask.
+        """
+        start_time = time.time()
+        overlay_frame = frame.copy()
 
-                # Add overlap threshold info
-                threshold_text = f"Threshold: {roi_data.overlap_threshold:.2f}"
-                cv2.putText(overlay_frame, threshold_text, (x1 + 10, y1 + 60),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors['text'], 1)
+        try:
+            overlay, mask = self._get_overlay_template(frame.shape, camera_name, overlapping_rois or [])
+            cv2.copyTo(overlay, mask, overlay_frame)
 
             # Update performance stats
             render_time = time.time() - start_time
@@ -1098,40 +1131,74 @@ class ROIVisualizer:
             log_error(SystemComponent.CAMERA, f"Error drawing ROI overlays: {e}")
             return frame
 
+    def _draw_roi_shapes(self, overlay_frame: np.ndarray, camera_rois: Dict,
+                         overlapping_rois) -> None:
+        """Draw rectangles, corner markers and labels for a camera's active ROIs"""
+        for roi_id, roi_data in camera_rois.items():
+            if not roi_data.active:
+                continue
+
+            coordinates = roi_data.coordinates
+            x1, y1, x2, y2 = coordinates
+
+            # Determine color based on overlap status
+            if roi_id in overlapping_rois:
+                color = self.colors['overlap']
+                status_text = "OVERLAP"
+            else:
+                color = self.colors['active']
+                status_text = "ACTIVE"
+
+            # Draw ROI rectangle
+            cv2.rectangle(overlay_frame, (x1, y1), (x2, y2), color, 3)
+
+            # Draw corner markers
+            marker_size = 15
+            # Top-left
+            cv2.line(overlay_frame, (x1, y1), (x1 + marker_size, y1), color, 2)
+            cv2.line(overlay_frame, (x1, y1), (x1, y1 + marker_size), color, 2)
+            # Top-right
+            cv2.line(overlay_frame, (x2, y1), (x2 - marker_size, y1), color, 2)
+            cv2.line(overlay_frame, (x2, y1), (x2, y1 + marker_size), color, 2)
+            # Bottom-left
+            cv2.line(overlay_frame, (x1, y2), (x1 + marker_size, y2), color, 2)
+            cv2.line(overlay_frame, (x1, y2), (x1, y2 - marker_size), color, 2)
+            # Bottom-right
+            cv2.line(overlay_frame, (x2, y2), (x2 - marker_size, y2), color, 2)
+            cv2.line(overlay_frame, (x2, y2), (x2, y2 - marker_size), color, 2)
+
+            # Add ROI label
+            label = f"{roi_data.name} ({roi_id}) - {status_text}"
+            cv2.putText(overlay_frame, label, (x1 + 10, y1 + 30),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+
+            # Add overlap threshold info
+            threshold_text = f"Threshold: {roi_data.overlap_threshold:.2f}"
+            cv2.putText(overlay_frame, threshold_text, (x1 + 10, y1 + 60),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors['text'], 1)
+
     def draw_wood_detections(self, frame: np.ndarray,
                            wood_detections: List[WoodDetectionResult]) -> np.ndarray:
         """Draw wood detection bounding boxes"""
         overlay_frame = frame.copy()
 
         try:
-            for i, detection in enumerate(wood_detections):
-                if not detection.detected:
-                    continue
-
-                bbox = detection.bbox
+            detected = [(i, detection) for i, detection in enumerate(wood_detections) if detection.detected]
+            if not detected:
+                return overlay_frame
+            color = self.colors['wood']
+
+            # All boxes and their corner markers go in one polylines call each
+            boxes = np.array([detection.bbox for _, detection in detected], dtype=np.int32)
+            cv2.polylines(overlay_frame, boxes[:, self.BOX_POINT_INDEX], True, color, 3)
+            corners = boxes[:, self.CORNER_POINT_INDEX]
+            markers = (corners[:, :, None, :] + self.WOOD_MARKER_OFFSETS).reshape(-1, 3, 2)
+            cv2.polylines(overlay_frame, markers, False, color, 2)
+
+            for i, detection in detected:
+                x1, y1 = int(detection.bbox[0]), int(detection.bbox[1])
                 confidence = detection.confidence
 
-                x1, y1, x2, y2 = bbox
-                color = self.colors['wood']
-
-                # Draw bounding box
-                cv2.rectangle(overlay_frame, (x1, y1), (x2, y2), color, 3)
-
-                # Draw corner markers
-                marker_size = 10
-                # Top-left
-                cv2.line(overlay_frame, (x1, y1), (x1 + marker_size, y1), color, 2)
-                cv2.line(overlay_frame, (x1, y1), (x1, y1 + marker_size), color, 2)
-                # Top-right
-                cv2.line(overlay_frame, (x2, y1), (x2 - marker_size, y1), color, 2)
-                cv2.line(overlay_frame, (x2, y1), (x2, y1 + marker_size), color, 2)
-                # Bottom-left
-                cv2.line(overlay_frame, (x1, y2), (x1 + marker_size, y2), color, 2)
-                cv2.line(overlay_frame, (x1, y2), (x1, y2 - marker_size), color, 2)
-                # Bottom-right
-                cv2.line(overlay_frame, (x2, y2), (x2 - marker_size, y2), color, 2)
-                cv2.line(overlay_frame, (x2, y2), (x2, y2 - marker_size), color, 2)
-
                 # Add confidence label
                 label = f"Wood {i+1}: {confidence:.2f}"
                 cv2.putText(overlay_frame, label, (x1 + 10, y1 + 30),
@@ -100,20 +100,30 @@ class ColorRecognitionEngine:
 
         return hsv_ranges
 
-    def recognize_wood_color(self, frame: np.ndarray, mask: Optional[np.ndarray] = None) -> Dict:
-        """Analyze color features within masked region"""
+    def compute_color_masks(self, frame: np.ndarray) -> Dict:
+        """HSV range masks for every wood color, computed in one pass over the frame"""
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        return {color_name: cv2.inRange(hsv, lower, upper)
+                for color_name, (lower, upper) in self.hsv_ranges.items()}
+
+    def recognize_wood_color(self, frame: np.ndarray, mask: Optional[np.ndarray] = None,
+                             color_masks: Optional[Dict] = None) -> Dict:
+        """Analyze color features within masked region
+
+        color_masks from compute_color_masks lets several regions of the same
+        frame share one HSV conversion.
+        """
         try:
             if frame is None or frame.size == 0:
                 return {}
 
-            # Convert to HSV color space
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+            if color_masks is None:
+                color_masks = self.compute_color_masks(frame)
+            total_pixels = cv2.countNonZero(mask) if mask is not None else (frame.shape[0] * frame.shape[1])
 
             results = {}
-            for color_name, (lower, upper) in self.hsv_ranges.items():
+            for color_name, color_mask in color_masks.items():
                 try:
-                    # Create color mask
-                    color_mask = cv2.inRange(hsv, lower, upper)
 
                     # Apply region mask if provided
                     if mask is not None:
@@ -123,7 +133,6 @@ class ColorRecognitionEngine:
 
                     # Calculate color coverage
                     color_pixels = cv2.countNonZero(combined_mask)
-                    total_pixels = cv2.countNonZero(mask) if mask is not None else (frame.shape[0] * frame.shape[1])
 
                     if total_pixels > 0:
                         coverage = color_pixels / total_pixels
@@ -160,12 +169,18 @@ class ContourAnalyzer:
         self.approximation_method = cv2.CHAIN_APPROX_SIMPLE
         self.retrieval_mode = cv2.RETR_EXTERNAL
 
-    def find_wood_contours(self, edges: np.ndarray) -> List[Dict]:
-        """Find and filter contours for wood objects"""
+    def find_wood_contours(self, edges: np.ndarray, scale: float = 1.0) -> List[Dict]:
+        """Find and filter contours for wood objects
+
+        scale is the factor the edge map was downscaled by; bboxes, areas,
+        perimeters and contours are reported in full-resolution pixels.
+        """
         try:
             if edges is None or edges.size == 0:
                 return []
 
+            inv_scale = 1.0 / scale
+
             # Find contours
             contours, hierarchy = cv2.findContours(
                 edges.copy(), self.retrieval_mode, self.approximation_method
@@ -175,7 +190,7 @@ class ContourAnalyzer:
 
             for contour in contours:
                 try:
-                    area = cv2.contourArea(contour)
+                    area = cv2.contourArea(contour) * inv_scale * inv_scale
 
                     # Filter by area
                     if not (self.min_area <= area <= self.max_area):
@@ -183,10 +198,12 @@ class ContourAnalyzer:
 
                     # Get bounding box
                     x, y, w, h = cv2.boundingRect(contour)
+                    if scale != 1.0:
+                        x, y, w, h = int(x * inv_scale), int(y * inv_scale), int(w * inv_scale), int(h * inv_scale)
                     bbox = (x, y, x + w, y + h)
 
                     # Calculate additional features
-                    perimeter = cv2.arcLength(contour, True)
+                    perimeter = cv2.arcLength(contour, True) * inv_scale
                     circularity = 4 * np.pi * area / (perimeter * perimeter) if perimeter > 0 else 0
 
                     # Calculate aspect ratio
@@ -194,7 +211,7 @@ class ContourAnalyzer:
 
                     # Calculate solidity (area / convex hull area)
                     hull = cv2.convexHull(contour)
-                    hull_area = cv2.contourArea(hull)
+                    hull_area = cv2.contourArea(hull) * inv_scale * inv_scale
                     solidity = area / hull_area if hull_area > 0 else 0
 
                     detection = {
@@ -204,7 +221,8 @@ class ContourAnalyzer:
                         'circularity': circularity,
                         'aspect_ratio': aspect_ratio,
                         'solidity': solidity,
-                        'contour': contour
+                        'contour': contour if scale == 1.0 else (contour * inv_scale).astype(np.int32),
+                        'analysis_contour': contour
                     }
 
                     wood_detections.append(detection)
@@ -252,6 +270,8 @@ class WoodDetectionEngine:
     def __init__(self, config: Dict = None):
         self.config = config or {}
         self.confidence_threshold = self.config.get('confidence_threshold', 0.6)
+        # Frames wider than this are downscaled (INTER_AREA) before edge, contour and color analysis
+        self.analysis_max_width = self.config.get('analysis_max_width', 640)
 
         # Initialize components
         self.canny_detector = CannyEdgeDetector(self.config.get('canny', {}))
@@ -271,29 +291,40 @@ class WoodDetectionEngine:
                 logger.warning("Invalid frame provided to wood detection")
                 return []
 
+            # Analyze a downscaled copy; results are mapped back to full-resolution pixels
+            scale = min(1.0, self.analysis_max_width / frame.shape[1])
+            if scale < 1.0:
+                analysis_frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            else:
+                analysis_frame = frame
+
             # Step 1: Apply Canny edge detection
-            edges = self.canny_detector.detect_edges(frame)
+            edges = self.canny_detector.detect_edges(analysis_frame)
 
             # Step 2: Find contours
-            contours = self.contour_analyzer.find_wood_contours(edges)
+            contours = self.contour_analyzer.find_wood_contours(edges, scale)
 
             # Step 3: Filter contours by shape
             filtered_contours = self.contour_analyzer.filter_contours_by_shape(contours)
 
-            # Step 4: Analyze each potential wood region
+            # Step 4: Analyze each potential wood region; candidates share one HSV pass
             wood_detections = []
+            color_masks = self.color_recognizer.compute_color_masks(analysis_frame) if filtered_contours else None
             for contour_data in filtered_contours:
                 try:
+                    # The analysis-resolution contour is only needed for the mask below
+                    analysis_contour = contour_data.pop('analysis_contour')
+
                     # Extract region of interest
                     bbox = contour_data['bbox']
                     x1, y1, x2, y2 = bbox
 
                     # Create mask for the contour
-                    mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-                    cv2.drawContours(mask, [contour_data['contour']], -1, 255, -1)
+                    mask = np.zeros(analysis_frame.shape[:2], dtype=np.uint8)
+                    cv2.drawContours(mask, [analysis_contour], -1, 255, -1)
 
                     # Analyze color within the masked region
-                    color_results = self.color_recognizer.recognize_wood_color(frame, mask)
+                    color_results = self.color_recognizer.recognize_wood_color(analysis_frame, mask, color_masks)
 
                     # Calculate confidence score
                     confidence = self._calculate_confidence(contour_data, color_results)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the GUI grading path
+
+Runs calculate_and_display_grade and update_defect_details against a mock
+window with the defect data shapes the live detection path produces.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from modules.gui_module import WoodSortingApp
+
+
+def make_window(current_defects):
+    """Build a mock window that runs the real grading and defect details methods"""
+    window = Mock()
+    window.predict_stream_active = False
+    window._last_defect_details_sig = None
+    window.current_defects = current_defects
+    window.update_defect_details = (
+        lambda *args: WoodSortingApp.update_defect_details(window, *args)
+    )
+    return window
+
+
+class TestGradingDisplay(unittest.TestCase):
+    """Grading must reach the detection state and Arduino steps"""
+
+    def test_grade_with_both_cameras(self):
+        window = make_window({
+            "top": {"defects": {"Sound_Knot": 2},
+                    "defect_list": [("Sound_Knot", 10.0, 20.0), ("Sound_Knot", 30.0, 40.0)]},
+            "bottom": {"defects": {"Unsound_Knot": 1},
+                       "defect_list": [("Unsound_Knot", 50.0, 60.0)]},
+        })
+
+        WoodSortingApp.calculate_and_display_grade(window)
+
+        window.display_message.assert_not_called()
+        window.update_detection_state.assert_called_once_with("Grading")
+        window._send_grade_to_arduino.assert_called_once()
+
+        details = window.defect_details_text.setPlainText.call_args[0][0]
+        self.assertIn("1. Sound_Knot at (10.0, 20.0)", details)
+        self.assertIn("3. Unsound_Knot at (50.0, 60.0)", details)
+
+    def test_grade_without_defects(self):
+        window = make_window({})
+
+        WoodSortingApp.calculate_and_display_grade(window)
+
+        window.display_message.assert_not_called()
+        window._send_grade_to_arduino.assert_called_once()
+        details = window.defect_details_text.setPlainText.call_args[0][0]
+        self.assertNotIn("DETAILED DEFECTS", details)
+
+    def test_unchanged_details_are_skipped(self):
+        window = make_window({})
+        defect_list = [("Sound_Knot", 10.0, 20.0)]
+
+        WoodSortingApp.update_defect_details(window, {"Sound_Knot": 1}, defect_list, {})
+        WoodSortingApp.update_defect_details(window, {"Sound_Knot": 1}, list(defect_list), {})
+
+        self.assertEqual(window.defect_details_text.setPlainText.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
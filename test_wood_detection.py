@@ -131,6 +131,49 @@ def test_contour_analysis():
         print(f"✗ Contour analysis test failed: {e}")
         return False
 
+def test_downscaled_analysis():
+    """Test that downscaled analysis reports full-resolution geometry"""
+    print("\n=== Testing Downscaled Analysis ===")
+
+    try:
+        contour_analyzer = ContourAnalyzer(DEFAULT_CONFIG['contour'])
+
+        # Same edge map analyzed as-is and as if it were downscaled by half
+        edges = np.zeros((200, 200), dtype=np.uint8)
+        cv2.rectangle(edges, (50, 50), (150, 150), 255, 2)
+        full = contour_analyzer.find_wood_contours(edges)[0]
+        scaled = contour_analyzer.find_wood_contours(edges, 0.5)[0]
+
+        expected_bbox = tuple(v * 2 for v in full['bbox'])
+        if scaled['bbox'] != expected_bbox:
+            print(f"✗ Bbox not mapped to full resolution: {scaled['bbox']} != {expected_bbox}")
+            return False
+        if abs(scaled['area'] - full['area'] * 4) > 1e-6:
+            print(f"✗ Area not mapped to full resolution: {scaled['area']} != {full['area'] * 4}")
+            return False
+        print(f"✓ Bbox and area reported at full resolution: {scaled['bbox']}, {scaled['area']:.0f}")
+
+        # A frame wider than analysis_max_width goes through the downscaled path
+        engine = WoodDetectionEngine(DEFAULT_CONFIG)
+        test_frame = np.zeros((960, 1280, 3), dtype=np.uint8)
+        cv2.rectangle(test_frame, (200, 200), (800, 600), (80, 50, 30), -1)
+        detections = engine.detect_wood(test_frame)
+
+        # The board's right edge (x=800) lies beyond the 640px analysis width
+        if detections and max(d.bbox[2] for d in detections) <= 640:
+            print("✗ Detection bboxes look like analysis-resolution pixels")
+            return False
+        for detection in detections:
+            if 'analysis_contour' in detection.features['contour_data']:
+                print("✗ Analysis contour leaked into detection features")
+                return False
+        print(f"✓ Downscaled pipeline returned {len(detections)} full-resolution detections")
+        return True
+
+    except Exception as e:
+        print(f"✗ Downscaled analysis test failed: {e}")
+        return False
+
 def test_full_pipeline():
     """Test complete wood detection pipeline"""
     print("\n=== Testing Full Detection Pipeline ===")
@@ -235,6 +278,7 @@ def main():
         test_edge_detection,
         test_color_recognition,
         test_contour_analysis,
+        test_downscaled_analysis,
         test_full_pipeline,
         test_performance_stats,
         test_error_handling